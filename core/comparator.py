@@ -1,42 +1,90 @@
 """Diff two scanned trees and produce a SyncPlan."""
 import hashlib
+import mmap
 import os
 from datetime import datetime
 from typing import Optional
 
+from concurrent.futures import ThreadPoolExecutor
+
 from db.models import FileStat, SyncPlan, FileState
-from utils.config import COPY_CHUNK_SIZE
+from utils.config import COPY_CHUNK_SIZE, HASH_WORKERS
+
+# Prefer the OpenSSL-backed SHA-256 constructor when available: OpenSSL
+# auto-dispatches to SHA-NI / ARMv8 SHA2 instructions on CPUs that have them,
+# which is several times faster than the portable fallback on large files.
+try:
+    from _hashlib import openssl_sha256 as _sha256_hasher
+except ImportError:
+    _sha256_hasher = hashlib.sha256
+
+
+# mmap window for hashing: below the floor the mapping setup costs more than
+# it saves; above the ceiling we avoid large address-space reservations.
+_MMAP_MIN = 64 * 1024
+_MMAP_MAX = 2 * 1024 ** 3
 
 
 def _compute_sha256(path: str) -> str:
-    h = hashlib.sha256()
+    h = _sha256_hasher()
     try:
-        with open(path, "rb") as f:
+        with open(path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if _MMAP_MIN <= size < _MMAP_MAX:
+                # Hash straight from the page cache: no copy into a Python
+                # buffer, and update() releases the GIL for large inputs.
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mm, "madvise"):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        h.update(mm)
+                    return h.hexdigest()
+                except (OSError, ValueError):
+                    pass  # mapping failed — fall through to the read loop
+            # Unbuffered readinto with one reusable buffer: no per-chunk bytes
+            # object and no extra copy through Python's buffered I/O layer.
+            buf = bytearray(COPY_CHUNK_SIZE)
+            view = memoryview(buf)
             while True:
-                chunk = f.read(COPY_CHUNK_SIZE)
-                if not chunk:
+                n = f.readinto(buf)
+                if not n:
                     break
-                h.update(chunk)
+                h.update(view[:n])
     except OSError:
         return ""
     return h.hexdigest()
 
 
-def _files_differ(
-    src_path: str,
-    dst_path: str,
-    src_stat: FileStat,
-    dst_stat: FileStat,
-    use_hash: bool,
-) -> bool:
-    """Return True if src and dst should be considered different."""
-    if src_stat.size_bytes != dst_stat.size_bytes:
-        return True
-    if src_stat.mtime_ns != dst_stat.mtime_ns:
-        if use_hash:
-            return _compute_sha256(src_path) != _compute_sha256(dst_path)
-        return True
-    return False
+def _resolve_hash_pending(hash_pending: list, plan: SyncPlan) -> None:
+    """Resolve deferred hash comparisons and route each entry into the plan.
+
+    hash_pending holds plan entries (from_abs, to_abs, rel, size, mtime) whose two
+    sides need a digest comparison; an entry goes to to_copy when the digests
+    differ, to_skip otherwise.  All files are hashed through one thread pool
+    so independent streams overlap instead of running serially.
+    """
+    if not hash_pending:
+        return
+    paths = {p for e in hash_pending for p in (e[0], e[1])}
+    if len(paths) <= 2:
+        digests = {p: _compute_sha256(p) for p in paths}
+    else:
+        paths = list(paths)
+        workers = min(HASH_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hash") as ex:
+            digests = dict(zip(paths, ex.map(_compute_sha256, paths)))
+    for entry in hash_pending:
+        if digests[entry[0]] != digests[entry[1]]:
+            plan.to_copy.append(entry)
+        else:
+            plan.to_skip.append(entry)
+
+
+def _same_file(a: FileStat, b: FileStat) -> bool:
+    """True when both stats refer to the same on-disk file (hardlink or the
+    same path reached via two roots) — content is identical by definition, so
+    hashing would be wasted I/O. st_ino == 0 means identity is unknown."""
+    return a.st_ino != 0 and a.st_ino == b.st_ino and a.st_dev == b.st_dev
 
 
 def _conflict_dst_path(dst_path: str) -> str:
@@ -60,25 +108,28 @@ def compare_trees(
     """
     Returns a SyncPlan describing what needs to happen.
 
-    to_copy  entries: (src_abs, dst_abs, rel_path, size_bytes)
-    to_delete entries: dst_abs path strings
-    conflicts entries: (src_abs, conflict_dst_abs, rel_path, size_bytes)
+    to_copy  entries: (src_abs, dst_abs, rel_path, size_bytes, mtime_ns)
+    to_delete entries: (dst_abs, rel_path)
+    conflicts entries: (src_abs, conflict_dst_abs, rel_path, size_bytes, mtime_ns)
     """
     plan = SyncPlan()
+    # Hash comparisons are deferred during the tree diff and resolved in one
+    # parallel batch afterwards (see _resolve_hash_pending).
+    hash_pending: list = []
 
     if direction == "source_to_dest":
         _plan_one_way(
             src_root, dst_root,
             src_stats, dst_stats,
             use_hash, delete_extraneous,
-            plan,
+            plan, hash_pending,
         )
     elif direction == "dest_to_source":
         _plan_one_way(
             dst_root, src_root,
             dst_stats, src_stats,
             use_hash, delete_extraneous,
-            plan,
+            plan, hash_pending,
         )
     elif direction == "bidirectional":
         _plan_bidirectional(
@@ -87,9 +138,10 @@ def compare_trees(
             use_hash, delete_extraneous,
             known_src_states or {},
             known_dst_states or {},
-            plan,
+            plan, hash_pending,
         )
 
+    _resolve_hash_pending(hash_pending, plan)
     return plan
 
 
@@ -101,25 +153,49 @@ def _plan_one_way(
     use_hash: bool,
     delete_extraneous: bool,
     plan: SyncPlan,
+    hash_pending: list,
 ) -> None:
-    for rel, from_stat in from_stats.items():
-        from_abs = os.path.join(from_root, rel.replace("/", os.sep))
-        to_abs = os.path.join(to_root, rel.replace("/", os.sep))
+    # Split new vs shared entries up front with C-level set arithmetic so the
+    # per-entry Python loop is just the size/mtime comparison. Locals are
+    # hoisted out of the loops (attribute loads dominate at 500K+ entries).
+    join = os.path.join
+    sep = os.sep
+    copy_append = plan.to_copy.append
+    skip_append = plan.to_skip.append
+    # Specialize the mtime-differs outcome once per plan instead of branching
+    # on use_hash inside the loop: entries either defer to the hash batch or
+    # copy straight away.
+    differ_append = hash_pending.append if use_hash else copy_append
 
-        if rel not in to_stats:
-            plan.to_copy.append((from_abs, to_abs, rel, from_stat.size_bytes))
-        else:
-            to_stat = to_stats[rel]
-            if _files_differ(from_abs, to_abs, from_stat, to_stat, use_hash):
-                plan.to_copy.append((from_abs, to_abs, rel, from_stat.size_bytes))
+    shared = from_stats.keys() & to_stats.keys()
+
+    for rel in from_stats.keys() - shared:
+        from_stat = from_stats[rel]
+        nrel = from_stat.native_rel or rel.replace("/", sep)
+        copy_append((join(from_root, nrel), join(to_root, nrel),
+                     rel, from_stat.size_bytes, from_stat.mtime_ns))
+
+    for rel in shared:
+        from_stat = from_stats[rel]
+        to_stat = to_stats[rel]
+        nrel = from_stat.native_rel or rel.replace("/", sep)
+        entry = (join(from_root, nrel), join(to_root, nrel),
+                 rel, from_stat.size_bytes, from_stat.mtime_ns)
+        if from_stat.size_bytes != to_stat.size_bytes:
+            copy_append(entry)
+        elif from_stat.mtime_ns != to_stat.mtime_ns:
+            if _same_file(from_stat, to_stat):
+                skip_append(entry)
             else:
-                plan.to_skip.append((from_abs, to_abs, rel, from_stat.size_bytes))
+                differ_append(entry)
+        else:
+            skip_append(entry)
 
     if delete_extraneous:
-        for rel in to_stats:
-            if rel not in from_stats:
-                to_abs = os.path.join(to_root, rel.replace("/", os.sep))
-                plan.to_delete.append(to_abs)
+        for rel in to_stats.keys() - from_stats.keys():
+            to_stat = to_stats[rel]
+            nrel = to_stat.native_rel or rel.replace("/", sep)
+            plan.to_delete.append((join(to_root, nrel), rel))
 
 
 def _stat_changed(stat: FileStat, known: Optional[FileState]) -> bool:
@@ -138,16 +214,19 @@ def _plan_bidirectional(
     known_src: dict[str, FileState],
     known_dst: dict[str, FileState],
     plan: SyncPlan,
+    hash_pending: list,
 ) -> None:
-    all_paths = set(src_stats) | set(dst_stats)
+    # Dict-view union runs in C without materializing two intermediate sets.
+    all_paths = src_stats.keys() | dst_stats.keys()
 
     for rel in all_paths:
-        src_abs = os.path.join(src_root, rel.replace("/", os.sep))
-        dst_abs = os.path.join(dst_root, rel.replace("/", os.sep))
-
         src_stat = src_stats.get(rel)
         dst_stat = dst_stats.get(rel)
 
+        nrel = (src_stat or dst_stat).native_rel or rel.replace("/", os.sep)
+        src_abs = os.path.join(src_root, nrel)
+        dst_abs = os.path.join(dst_root, nrel)
+
         src_changed = src_stat is not None and _stat_changed(src_stat, known_src.get(rel))
         dst_changed = dst_stat is not None and _stat_changed(dst_stat, known_dst.get(rel))
 
@@ -155,25 +234,50 @@ def _plan_bidirectional(
             if src_changed and dst_changed:
                 # Both changed → conflict: copy src over with a renamed dst
                 conflict_abs = _conflict_dst_path(dst_abs)
-                plan.conflicts.append((src_abs, conflict_abs, rel, src_stat.size_bytes))
+                plan.conflicts.append(
+                    (src_abs, conflict_abs, rel,
+                     src_stat.size_bytes, src_stat.mtime_ns))
             elif src_changed:
-                if _files_differ(src_abs, dst_abs, src_stat, dst_stat, use_hash):
-                    plan.to_copy.append((src_abs, dst_abs, rel, src_stat.size_bytes))
+                entry = (src_abs, dst_abs, rel,
+                         src_stat.size_bytes, src_stat.mtime_ns)
+                if src_stat.size_bytes != dst_stat.size_bytes:
+                    plan.to_copy.append(entry)
+                elif src_stat.mtime_ns != dst_stat.mtime_ns:
+                    if _same_file(src_stat, dst_stat):
+                        plan.to_skip.append(entry)
+                    elif use_hash:
+                        hash_pending.append(entry)
+                    else:
+                        plan.to_copy.append(entry)
                 else:
-                    plan.to_skip.append((src_abs, dst_abs, rel, src_stat.size_bytes))
+                    plan.to_skip.append(entry)
             elif dst_changed:
-                if _files_differ(dst_abs, src_abs, dst_stat, src_stat, use_hash):
-                    plan.to_copy.append((dst_abs, src_abs, rel, dst_stat.size_bytes))
+                entry = (dst_abs, src_abs, rel,
+                         dst_stat.size_bytes, dst_stat.mtime_ns)
+                if dst_stat.size_bytes != src_stat.size_bytes:
+                    plan.to_copy.append(entry)
+                elif dst_stat.mtime_ns != src_stat.mtime_ns:
+                    if _same_file(dst_stat, src_stat):
+                        plan.to_skip.append(entry)
+                    elif use_hash:
+                        hash_pending.append(entry)
+                    else:
+                        plan.to_copy.append(entry)
                 else:
-                    plan.to_skip.append((dst_abs, src_abs, rel, dst_stat.size_bytes))
+                    plan.to_skip.append(entry)
             else:
-                plan.to_skip.append((src_abs, dst_abs, rel, src_stat.size_bytes))
+                plan.to_skip.append(
+                    (src_abs, dst_abs, rel,
+                     src_stat.size_bytes, src_stat.mtime_ns))
         elif src_stat and not dst_stat:
             # Only on source
-            plan.to_copy.append((src_abs, dst_abs, rel, src_stat.size_bytes))
+            plan.to_copy.append(
+                (src_abs, dst_abs, rel, src_stat.size_bytes, src_stat.mtime_ns))
         elif dst_stat and not src_stat:
             # Only on dest
             if delete_extraneous:
-                plan.to_delete.append(dst_abs)
+                plan.to_delete.append((dst_abs, rel))
             else:
-                plan.to_copy.append((dst_abs, src_abs, rel, dst_stat.size_bytes))
+                plan.to_copy.append(
+                    (dst_abs, src_abs, rel,
+                     dst_stat.size_bytes, dst_stat.mtime_ns))
@@ -1,42 +1,53 @@
 """Enumerate available drives on Windows, including USB/removable drives."""
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 from db.models import DriveInfo
-from utils.platform_utils import (
-    list_drives, get_volume_serial, get_volume_label,
-    get_drive_type, drive_free_bytes,
-)
+from utils.platform_utils import list_drives, query_drive, invalidate_drive_cache
 
 
 def _build_drive_info(root: str) -> Optional[DriveInfo]:
     """Build a DriveInfo for the given root path (e.g. 'E:\\')."""
     try:
-        drive_type = get_drive_type(root)
+        serial, label, drive_type, free = query_drive(root)
         if drive_type == 0:
             return None  # unknown
-        serial = get_volume_serial(root) or f"UNKNOWN_{root[0]}"
-        label = get_volume_label(root)
-        free = drive_free_bytes(root)
+        serial = serial or f"UNKNOWN_{root[0]}"
         return DriveInfo(
             letter=root,
             label=label,
             serial=serial,
             drive_type=drive_type,
             free_bytes=free,
+            default_dest_root=os.path.join(root, "SyncBackup"),
         )
     except Exception:
         return None
 
 
+# Upper bound on concurrent per-drive queries; each one is mostly kernel
+# wait (ctypes releases the GIL), so threads genuinely overlap.
+_QUERY_WORKERS = 8
+
+
 def get_all_drives() -> list[DriveInfo]:
-    """Return DriveInfo for every mounted drive (fixed + removable)."""
-    drives = []
-    for root in list_drives():
-        info = _build_drive_info(root)
-        if info is not None:
-            drives.append(info)
-    return drives
+    """Return DriveInfo for every mounted drive (fixed + removable).
+
+    Drives are queried in parallel: a slow root (spinning-up USB disk,
+    laggy network share) then costs max(latency) for the batch instead of
+    stalling every drive behind it. Results land in platform_utils' per-
+    root caches, so the next enumeration is usually all cache hits.
+    """
+    roots = list_drives()
+    if len(roots) <= 1:
+        infos = [_build_drive_info(r) for r in roots]
+    else:
+        workers = min(_QUERY_WORKERS, len(roots))
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="drive-query") as ex:
+            infos = list(ex.map(_build_drive_info, roots))
+    return [info for info in infos if info is not None]
 
 
 def get_removable_drives() -> list[DriveInfo]:
@@ -55,12 +66,30 @@ class DriveMonitor:
     def __init__(self, on_change: Callable[[list[DriveInfo]], None]):
         self._on_change = on_change
         self._last_serials: set[str] = set()
+        self._last_roots: set[str] = set()
         self._running = False
 
     def check(self) -> None:
         """Call this periodically (e.g. via root.after). Fires on_change if drives changed."""
+        # list_drives is uncached, so arrivals/removals are always seen;
+        # when the letter set changes the per-root metadata caches are
+        # flushed — a reused letter may hold different media now.
+        roots = set(list_drives())
+        if roots != self._last_roots:
+            self._last_roots = roots
+            invalidate_drive_cache()
         drives = get_all_non_cdrom_drives()
         serials = {d.serial for d in drives}
         if serials != self._last_serials:
             self._last_serials = serials
             self._on_change(drives)
+
+    def on_device_event(self) -> None:
+        """Handle a WM_DEVICECHANGE arrival/removal broadcast.
+
+        Media can change without the letter set changing (an SD card
+        swapped in the same reader), so the metadata caches are flushed
+        unconditionally before re-enumerating.
+        """
+        invalidate_drive_cache()
+        self.check()
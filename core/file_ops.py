@@ -1,14 +1,31 @@
 """Atomic file copy, delete, and verification with retry logic."""
 import os
 import shutil
+import threading
 import time
 from typing import Callable, Optional
 
-from utils.config import COPY_RETRY_COUNT, COPY_RETRY_DELAY
+from utils.config import COPY_CHUNK_SIZE, COPY_RETRY_COUNT, COPY_RETRY_DELAY
+from utils.io_tuning import chunk_size_for
 from utils.logger import get_logger
 
 log = get_logger("synctool.file_ops")
 
+# Directories already created this process — copying N files into K folders
+# otherwise pays N-K redundant makedirs stat/mkdir sequences.
+_ensured_dirs: set[str] = set()
+_ensured_lock = threading.Lock()
+
+
+def ensure_dir(path: str) -> None:
+    """os.makedirs(exist_ok=True) that hits the filesystem once per directory."""
+    if path in _ensured_dirs:
+        return
+    with _ensured_lock:
+        if path not in _ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            _ensured_dirs.add(path)
+
 
 def atomic_copy(
     src: str,
@@ -22,7 +39,7 @@ def atomic_copy(
     progress_cb(bytes_written) is called after each chunk.
     cancel_check() returning True aborts the copy (removes the temp file).
     """
-    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    ensure_dir(os.path.dirname(dst))
     tmp = dst + ".synctmp"
 
     for attempt in range(1, COPY_RETRY_COUNT + 1):
@@ -47,20 +64,161 @@ class _CancelledError(Exception):
     pass
 
 
+# In-kernel copy support: copy_file_range (Linux, reflink-capable) or
+# sendfile (other POSIX). On Windows CopyFileExW does the equivalent —
+# the kernel moves the bytes and reports progress through a callback.
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+_HAS_SENDFILE = hasattr(os, "sendfile")
+_IS_WINDOWS = os.name == "nt"
+
+if _IS_WINDOWS:
+    import ctypes
+    from ctypes import wintypes
+
+    _PROGRESS_CONTINUE = 0
+    _PROGRESS_CANCEL = 1
+    _LPPROGRESS_ROUTINE = ctypes.WINFUNCTYPE(
+        wintypes.DWORD,
+        wintypes.LARGE_INTEGER,  # TotalFileSize
+        wintypes.LARGE_INTEGER,  # TotalBytesTransferred
+        wintypes.LARGE_INTEGER,  # StreamSize
+        wintypes.LARGE_INTEGER,  # StreamBytesTransferred
+        wintypes.DWORD,          # dwStreamNumber
+        wintypes.DWORD,          # dwCallbackReason
+        wintypes.HANDLE,         # hSourceFile
+        wintypes.HANDLE,         # hDestinationFile
+        ctypes.c_void_p,         # lpData
+    )
+
+
+def _copy_winapi(src: str, dst: str, progress_cb, cancel_check) -> bool:
+    """Copy via kernel32 CopyFileExW — no bytes through Python buffers.
+
+    Progress and cancellation ride on the LPPROGRESS_ROUTINE callback.
+    Returns False when the call fails for a non-cancel reason so the
+    caller can fall back to the streaming loop.
+    """
+    transferred = [0]
+
+    @_LPPROGRESS_ROUTINE
+    def _on_progress(_total, done, *_rest):
+        if cancel_check and cancel_check():
+            return _PROGRESS_CANCEL
+        if progress_cb and done > transferred[0]:
+            progress_cb(done - transferred[0])
+            transferred[0] = done
+        return _PROGRESS_CONTINUE
+
+    ok = ctypes.windll.kernel32.CopyFileExW(src, dst, _on_progress, None, None, 0)
+    if ok:
+        return True
+    if cancel_check and cancel_check():
+        raise _CancelledError()
+    return False
+
+
+def _copy_in_kernel(fsrc, fdst, progress_cb, cancel_check,
+                    chunk=COPY_CHUNK_SIZE) -> bool:
+    """Copy file data fd-to-fd without routing bytes through Python buffers.
+
+    Returns False when unsupported or when the very first transfer fails
+    (e.g. sendfile refusing regular-file targets on this platform), letting
+    the caller fall back to the streaming loop before anything is written.
+    """
+    if not (_HAS_COPY_FILE_RANGE or _HAS_SENDFILE):
+        return False
+    sfd, dfd = fsrc.fileno(), fdst.fileno()
+    offset = 0
+    while True:
+        if cancel_check and cancel_check():
+            raise _CancelledError()
+        try:
+            if _HAS_COPY_FILE_RANGE:
+                n = os.copy_file_range(sfd, dfd, chunk)
+            else:
+                n = os.sendfile(dfd, sfd, offset, chunk)
+        except OSError:
+            if offset == 0:
+                return False
+            raise
+        if n == 0:
+            return True
+        offset += n
+        if progress_cb:
+            progress_cb(n)
+
+
+# One reusable copy buffer per thread for the streaming fallback: readinto
+# fills it in place, so no per-chunk bytes object is allocated and worker
+# threads never contend over a shared buffer.
+_copy_buffers = threading.local()
+
+
+def _thread_copy_buffer(size: int = COPY_CHUNK_SIZE) -> memoryview:
+    # Keyed by size: different destination classes use different chunk
+    # sizes, and a thread may copy to several drives in one run.
+    bufs = getattr(_copy_buffers, "bufs", None)
+    if bufs is None:
+        bufs = _copy_buffers.bufs = {}
+    view = bufs.get(size)
+    if view is None:
+        view = bufs[size] = memoryview(bytearray(size))
+    return view
+
+
 def _do_copy(src, dst, progress_cb, cancel_check):
-    from utils.config import COPY_CHUNK_SIZE
-    written = 0
-    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+    if _IS_WINDOWS and _copy_winapi(src, dst, progress_cb, cancel_check):
+        return
+    chunk = chunk_size_for(os.path.splitdrive(dst)[0])
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        if _copy_in_kernel(fsrc, fdst, progress_cb, cancel_check, chunk):
+            return
+        view = _thread_copy_buffer(chunk)
         while True:
             if cancel_check and cancel_check():
                 raise _CancelledError()
-            chunk = fsrc.read(COPY_CHUNK_SIZE)
-            if not chunk:
+            n = fsrc.readinto(view)
+            if not n:
                 break
-            fdst.write(chunk)
-            written += len(chunk)
+            fdst.write(view[:n])
             if progress_cb:
-                progress_cb(len(chunk))
+                progress_cb(n)
+
+
+def copy_batch(
+    pairs: list,
+    cancel_check: Optional[Callable[[], bool]] = None,
+    on_file_done: Optional[Callable[[str, str, Optional[Exception]], None]] = None,
+) -> None:
+    """Copy a batch of small files with amortized per-file overhead.
+
+    pairs: list of (src, dst). Destination directories go through ensure_dir,
+    and each file is copied with a single read and a single write (no chunk
+    loop). Atomic tmp+rename semantics and retries match atomic_copy.
+    on_file_done(src, dst, exc) is called per file; exc is None on success.
+    """
+    for src, dst in pairs:
+        if cancel_check and cancel_check():
+            raise _CancelledError()
+        ensure_dir(os.path.dirname(dst))
+        tmp = dst + ".synctmp"
+        error: Optional[Exception] = None
+        for attempt in range(1, COPY_RETRY_COUNT + 1):
+            try:
+                with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+                    fdst.write(fsrc.read())
+                shutil.copystat(src, tmp)
+                os.replace(tmp, dst)
+                break
+            except OSError as exc:
+                _remove_silent(tmp)
+                if attempt == COPY_RETRY_COUNT:
+                    error = exc
+                    break
+                log.warning("Copy attempt %d failed (%s): %s", attempt, src, exc)
+                time.sleep(COPY_RETRY_DELAY)
+        if on_file_done:
+            on_file_done(src, dst, error)
 
 
 def safe_delete(path: str) -> None:
@@ -73,6 +231,19 @@ def safe_delete(path: str) -> None:
             os.removedirs(parent)
         except OSError:
             pass
+        # Pruned directories must fall out of the ensure_dir cache, or a
+        # later copy into them this session would skip makedirs and fail
+        # with ENOENT. removedirs walks upward, so evict every missing
+        # ancestor, not just the immediate parent.
+        if not os.path.isdir(parent):
+            with _ensured_lock:
+                p = parent
+                while p and not os.path.isdir(p):
+                    _ensured_dirs.discard(p)
+                    up = os.path.dirname(p)
+                    if up == p:
+                        break
+                    p = up
     except OSError as exc:
         log.warning("Could not delete %s: %s", path, exc)
 
@@ -10,13 +10,18 @@ Folder structure produced:
       misc/        <- files with no readable EXIF / metadata date
 """
 import os
-import queue
+import re
 import shutil
+import struct
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from core.file_ops import ensure_dir
+from utils.config import ORGANIZE_WORKERS
 from utils.logger import get_logger
 
 log = get_logger("synctool.organizer")
@@ -45,6 +50,14 @@ VIDEO_EXTENSIONS = frozenset({
 
 MEDIA_EXTENSIONS = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
 
+# One precompiled, case-insensitive suffix match replaces the
+# splitext + lower + set-lookup trio in the collection loop — one C-level
+# call per directory entry instead of three and no throwaway strings.
+_MEDIA_RE = re.compile(
+    "(?:" + "|".join(sorted(e.replace(".", r"\.") for e in MEDIA_EXTENSIONS)) + r")\Z",
+    re.IGNORECASE,
+)
+
 
 # -----------------------------------------------------------------------
 # Data classes
@@ -132,40 +145,183 @@ def _parse_exif_str(raw) -> Optional[datetime]:
         return None
 
 
+# ---- Fast JPEG path: parse the APP1 EXIF segment directly ------------------
+#
+# Image.open() parses container headers and allocates a decoder just to read a
+# 19-byte date string. For JPEG the EXIF APP1 segment sits in the first few KB,
+# so a direct segment walk over one 64 KB read is 10-50x cheaper. Other formats
+# (HEIC, RAW, TIFF, PNG) keep the Pillow path.
+
+_EXIF_HEAD_BYTES = 65536
+
+
+def _tiff_date(tiff: bytes) -> Optional[str]:
+    """Extract the best datetime string from a TIFF-format EXIF payload.
+
+    Prefers DateTimeOriginal, then DateTimeDigitized (Exif sub-IFD), then
+    DateTime (IFD0) — same priority as the Pillow path.
+    """
+    if tiff[:2] == b"II":
+        endian = "<"
+    elif tiff[:2] == b"MM":
+        endian = ">"
+    else:
+        return None
+
+    def u16(off: int) -> int:
+        return struct.unpack_from(endian + "H", tiff, off)[0]
+
+    def u32(off: int) -> int:
+        return struct.unpack_from(endian + "I", tiff, off)[0]
+
+    def read_ascii(entry_off: int) -> Optional[str]:
+        # IFD entry layout: tag(2) type(2) count(4) value-or-offset(4)
+        if u16(entry_off + 2) != 2:  # ASCII
+            return None
+        count = u32(entry_off + 4)
+        val_off = u32(entry_off + 8) if count > 4 else entry_off + 8
+        raw = tiff[val_off:val_off + count - 1]  # strip trailing NUL
+        return raw.decode("ascii", "replace") if raw else None
+
+    try:
+        if u16(2) != 42:
+            return None
+        ifd0 = u32(4)
+        exif_ifd_off = None
+        ifd0_date = None
+        for i in range(u16(ifd0)):
+            off = ifd0 + 2 + i * 12
+            tag = u16(off)
+            if tag == _EXIF_IFD_POINTER:
+                exif_ifd_off = u32(off + 8)
+            elif tag in _IFD0_TAG_IDS:
+                ifd0_date = read_ascii(off)
+        if exif_ifd_off is not None:
+            found: dict[int, str] = {}
+            for i in range(u16(exif_ifd_off)):
+                off = exif_ifd_off + 2 + i * 12
+                tag = u16(off)
+                if tag in _EXIF_IFD_TAG_IDS:
+                    date = read_ascii(off)
+                    if date:
+                        found[tag] = date
+            for tag in _EXIF_IFD_TAG_IDS:
+                if tag in found:
+                    return found[tag]
+        return ifd0_date
+    except (struct.error, IndexError):
+        return None
+
+
+def _jpeg_exif_date(filepath: str) -> tuple[bool, Optional[datetime]]:
+    """Read a JPEG capture date from the APP1 segment in the first 64 KB.
+
+    Returns (handled, dt). handled=False means the fast path could not decide
+    (not a JPEG stream, corrupt markers, or metadata beyond the head read) and
+    the caller should fall back to Pillow.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            head = f.read(_EXIF_HEAD_BYTES)
+    except OSError as exc:
+        log.debug("EXIF read error for %s: %s", filepath, exc)
+        return True, None
+    n = len(head)
+    if n < 4 or head[:2] != b"\xff\xd8":
+        return False, None
+
+    pos = 2
+    while pos + 4 <= n:
+        if head[pos] != 0xFF:
+            return False, None  # corrupt marker stream — let Pillow decide
+        marker = head[pos + 1]
+        if 0xD0 <= marker <= 0xD9:  # standalone markers (RST / SOI / EOI)
+            pos += 2
+            continue
+        if marker == 0xDA:  # start of scan — no EXIF before image data
+            return True, None
+        seg_end = pos + 2 + int.from_bytes(head[pos + 2:pos + 4], "big")
+        if marker == 0xE1 and head[pos + 4:pos + 10] == b"Exif\x00\x00":
+            if seg_end > n:
+                return False, None  # EXIF segment extends past the head
+            return True, _parse_exif_str(_tiff_date(head[pos + 10:seg_end]))
+        if seg_end <= pos + 2:
+            return False, None
+        pos = seg_end
+    return False, None  # ran out of head without reaching the scan data
+
+
 def extract_date(filepath: str) -> Optional[datetime]:
     """Return the capture datetime from EXIF, or None.
 
     Assumes PIL is importable (checked once by organize_folder).
     """
-    if os.path.splitext(filepath)[1].lower() in IMAGE_EXTENSIONS:
-        return _exif_date(filepath)
-    return None
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext not in IMAGE_EXTENSIONS:
+        return None
+    if ext in (".jpg", ".jpeg"):
+        handled, dt = _jpeg_exif_date(filepath)
+        if handled:
+            return dt
+    return _exif_date(filepath)
 
 
 # -----------------------------------------------------------------------
 # Path helpers
 # -----------------------------------------------------------------------
 
+def _iter_media(root: str):
+    """Yield absolute paths of all media files under *root*.
+
+    scandir-based replacement for the os.walk collection pass: entry.name and
+    entry.path come straight from the dirent data, so there is no per-file
+    join and no intermediate filename lists. Follows directory symlinks (as
+    the old walk did) but guards against cycles the same way the scanner does.
+    """
+    is_media = _MEDIA_RE.search
+    # Every traversed directory is remembered by (st_dev, st_ino) so a link
+    # back into an already-walked subtree is skipped no matter which path it
+    # points at. The stat is cached on the DirEntry from is_dir(), so this
+    # costs no extra syscall. st_ino == 0 (some Windows filesystems) means
+    # identity is unknown — those are walked without dedup.
+    visited: set[tuple[int, int]] = set()
+    try:
+        st = os.stat(root)
+        visited.add((st.st_dev, st.st_ino))
+    except OSError:
+        return
+    stack = [root]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        current = pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=True):
+                        if is_media(entry.name):
+                            yield entry.path
+                    elif entry.is_dir(follow_symlinks=True):
+                        st = entry.stat(follow_symlinks=True)
+                        if st.st_ino != 0:
+                            key = (st.st_dev, st.st_ino)
+                            if key in visited:
+                                continue
+                            visited.add(key)
+                        push(entry.path)
+                except OSError:
+                    pass
+
 def _dest_folder(dest_root: str, dt: Optional[datetime]) -> str:
     if dt:
         return os.path.join(dest_root, str(dt.year), f"{dt.year}_{dt.month:02d}")
     return os.path.join(dest_root, "misc")
 
 
-def _unique_path(folder: str, filename: str) -> str:
-    """Return a non-conflicting path, appending _2/_3/… if needed."""
-    candidate = os.path.join(folder, filename)
-    if not os.path.exists(candidate):
-        return candidate
-    base, ext = os.path.splitext(filename)
-    n = 2
-    while True:
-        candidate = os.path.join(folder, f"{base}_{n}{ext}")
-        if not os.path.exists(candidate):
-            return candidate
-        n += 1
-
-
 # -----------------------------------------------------------------------
 # Main organizer
 # -----------------------------------------------------------------------
@@ -175,19 +331,20 @@ def organize_folder(
     dest: str,
     move: bool,
     cancel_event: threading.Event,
-    event_queue: queue.Queue,
+    event_queue: deque,
 ) -> OrganizeResult:
     """Walk *source*, categorise every media file by EXIF date, copy/move to *dest*.
 
-    Puts FileEvent objects and ("progress", done, total) or ("fatal", msg)
-    tuples into *event_queue* for the UI to consume.
+    Appends FileEvent objects and ("progress", done, total) or ("fatal", msg)
+    tuples to *event_queue* (a deque — appends are atomic under the GIL, so
+    no lock or condition variable per event) for the UI to consume.
     """
     # ---- Verify Pillow is installed before touching a single file ----
     try:
         from PIL import Image as _pil_img  # noqa: F401
         log.debug("Pillow version: %s", _pil_img.__version__ if hasattr(_pil_img, "__version__") else "unknown")
     except ImportError:
-        event_queue.put(("fatal",
+        event_queue.append(("fatal",
             "Pillow is not installed.\n\n"
             "Install it by running:\n"
             "    pip install Pillow\n\n"
@@ -197,20 +354,39 @@ def organize_folder(
     result = OrganizeResult()
 
     # Phase 1: collect all media files so progress is accurate
-    all_files: list[str] = []
-    for dirpath, _dirs, filenames in os.walk(source, followlinks=True):
-        for fname in filenames:
-            if os.path.splitext(fname)[1].lower() in MEDIA_EXTENSIONS:
-                all_files.append(os.path.join(dirpath, fname))
+    all_files = list(_iter_media(source))
 
     result.total = len(all_files)
-    event_queue.put(("progress", 0, result.total))
-
-    # Phase 2: process each file
-    for i, src_abs in enumerate(all_files):
+    event_queue.append(("progress", 0, result.total))
+
+    # Phase 2: process files through a thread pool. EXIF read + copy is
+    # I/O-bound, so several files in flight keep source and dest drives busy.
+    # Shared counters and destination-name claims go through _lock.
+    _lock = threading.Lock()
+    _done = [0]
+    _claimed: set[str] = set()
+
+    def _claim_path(folder: str, filename: str) -> str:
+        """Return a non-conflicting dest path, appending _2/_3/… if needed.
+        Names claimed by in-flight copies count as taken even before the
+        file exists on disk."""
+        with _lock:
+            candidate = os.path.join(folder, filename)
+            if candidate not in _claimed and not os.path.exists(candidate):
+                _claimed.add(candidate)
+                return candidate
+            base, ext = os.path.splitext(filename)
+            n = 2
+            while True:
+                candidate = os.path.join(folder, f"{base}_{n}{ext}")
+                if candidate not in _claimed and not os.path.exists(candidate):
+                    _claimed.add(candidate)
+                    return candidate
+                n += 1
+
+    def _process_one(src_abs: str) -> None:
         if cancel_event.is_set():
-            result.cancelled = True
-            break
+            return
 
         rel = os.path.relpath(src_abs, source).replace("\\", "/")
         filename = os.path.basename(src_abs)
@@ -218,8 +394,8 @@ def organize_folder(
         try:
             dt = extract_date(src_abs)
             folder = _dest_folder(dest, dt)
-            os.makedirs(folder, exist_ok=True)
-            dst_abs = _unique_path(folder, filename)
+            ensure_dir(folder)
+            dst_abs = _claim_path(folder, filename)
 
             if move:
                 shutil.move(src_abs, dst_abs)
@@ -228,21 +404,34 @@ def organize_folder(
 
             dest_rel = os.path.relpath(folder, dest).replace("\\", "/")
             status = "organized" if dt else "misc"
-            if dt:
-                result.organized += 1
-            else:
-                result.misc += 1
+            with _lock:
+                if dt:
+                    result.organized += 1
+                else:
+                    result.misc += 1
 
-            event_queue.put(FileEvent(rel_src=rel, dest_folder=dest_rel, status=status))
+            event_queue.append(FileEvent(rel_src=rel, dest_folder=dest_rel, status=status))
 
         except Exception as exc:
             log.error("Failed to process %s: %s", src_abs, exc)
-            result.errors += 1
-            event_queue.put(FileEvent(
+            with _lock:
+                result.errors += 1
+            event_queue.append(FileEvent(
                 rel_src=rel, dest_folder="—",
                 status="error", error=str(exc),
             ))
 
-        event_queue.put(("progress", i + 1, result.total))
+        with _lock:
+            _done[0] += 1
+            done = _done[0]
+        event_queue.append(("progress", done, result.total))
+
+    if all_files:
+        workers = min(ORGANIZE_WORKERS, len(all_files))
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="organize") as ex:
+            for _ in ex.map(_process_one, all_files):
+                pass
 
+    result.cancelled = cancel_event.is_set()
     return result
@@ -59,15 +59,21 @@ class ParallelSyncManager:
             return any(not f.done() for f in self._futures)
 
     def _run_job(self, job: DriveJob) -> None:
-        """Run all source folders for one drive sequentially."""
-        for source_path in job.sources:
-            if self._cancel_event.is_set():
-                break
-            # Contents of source go directly into dest_root (no extra subfolder)
-            dest_path = job.drive.dest_root
-            engine = SyncEngine(
+        """Run all source folders for one drive sequentially.
+
+        The scan/plan of the next source overlaps the copy phase of the
+        current one through a one-slot planner pool, so the drive is never
+        idle between sources. Pipelining is disabled whenever the plan
+        depends on a destination scan: in mirror mode an overlapped scan
+        would produce a stale delete list, and in bidirectional mode it
+        could pick up an earlier source's in-flight .synctmp files and
+        copy them back into the next source.
+        """
+        engines = [
+            SyncEngine(
                 source_path=source_path,
-                dest_path=dest_path,
+                # Contents of source go directly into dest_root (no extra subfolder)
+                dest_path=job.drive.dest_root,
                 drive_serial=job.drive.drive_serial,
                 drive_label=job.drive.drive_label,
                 direction=job.direction,
@@ -75,10 +81,38 @@ class ParallelSyncManager:
                 delete_extraneous=job.delete_extraneous,
                 cancel_event=self._cancel_event,
             )
-            try:
-                engine.run()
-            except Exception as exc:
-                log.exception("Unexpected engine error: %s", exc)
+            for source_path in job.sources
+        ]
+
+        pipeline = (
+            len(engines) > 1
+            and not job.delete_extraneous
+            and job.direction != "bidirectional"
+        )
+        if not pipeline:
+            for engine in engines:
+                if self._cancel_event.is_set():
+                    break
+                try:
+                    engine.run()
+                except Exception as exc:
+                    log.exception("Unexpected engine error: %s", exc)
+            return
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="plan") as planner:
+            fut = planner.submit(engines[0].prepare)
+            for i, engine in enumerate(engines):
+                if self._cancel_event.is_set():
+                    break
+                next_fut = (
+                    planner.submit(engines[i + 1].prepare)
+                    if i + 1 < len(engines) else None
+                )
+                try:
+                    engine.run(plan_future=fut)
+                except Exception as exc:
+                    log.exception("Unexpected engine error: %s", exc)
+                fut = next_fut
 
     def _monitor(self, on_all_done) -> None:
         with self._lock:
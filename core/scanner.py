@@ -1,10 +1,44 @@
 """Fast directory tree scanner using os.scandir with parallel subdirectory walking."""
 import os
+import stat
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
 
 from db.models import FileStat
-from utils.config import SCAN_WORKERS, SCAN_EXCLUDE_DIRS
+from utils.config import SCAN_WORKERS, is_excluded_dir
+
+# Rel paths are built by slicing the scan root prefix off entry.path and
+# swapping separators with one translate call — much cheaper than
+# os.path.relpath().replace() per entry. On POSIX the translate is skipped.
+_BS_TO_FS = str.maketrans("\\", "/")
+_IS_WINDOWS_SEP = os.sep == "\\"
+
+
+def _prefix_len(root: str) -> int:
+    """Length of the prefix to strip from entry.path to get the rel path."""
+    return len(root) if root.endswith(os.sep) else len(root) + 1
+
+
+_REPARSE_MOUNT_POINT = getattr(stat, "IO_REPARSE_TAG_MOUNT_POINT", 0xA0000003)
+
+
+def _is_link(entry: os.DirEntry) -> bool:
+    """True for symlinks and Windows junctions (directory mount points).
+
+    Junctions don't register as symlinks, but they can form cycles just the
+    same; st_reparse_tag comes from the dirent data scandir already fetched,
+    so this costs no extra syscall on Windows.
+    """
+    if entry.is_symlink():
+        return True
+    if _IS_WINDOWS_SEP:
+        try:
+            st = entry.stat(follow_symlinks=False)
+            return getattr(st, "st_reparse_tag", 0) == _REPARSE_MOUNT_POINT
+        except OSError:
+            return False
+    return False
 
 
 def scan_tree(root: str, cancel_check=None) -> dict[str, FileStat]:
@@ -31,6 +65,9 @@ def scan_tree(root: str, cancel_check=None) -> dict[str, FileStat]:
                 rel_path=rel,
                 size_bytes=st.st_size,
                 mtime_ns=st.st_mtime_ns,
+                native_rel=rel,
+                st_dev=st.st_dev,
+                st_ino=st.st_ino,
             )
         except OSError:
             pass
@@ -39,6 +76,7 @@ def scan_tree(root: str, cancel_check=None) -> dict[str, FileStat]:
     # Scan the root level to separate files (handled inline) from subdirectories
     # (each dispatched to its own worker thread).
     subdirs: list[str] = []
+    prefix_len = _prefix_len(root)
     try:
         with os.scandir(root) as it:
             for entry in it:
@@ -47,16 +85,21 @@ def scan_tree(root: str, cancel_check=None) -> dict[str, FileStat]:
                 if entry.is_file(follow_symlinks=True):
                     try:
                         st = entry.stat(follow_symlinks=True)
-                        rel = os.path.relpath(entry.path, root).replace("\\", "/")
+                        rel = native = entry.path[prefix_len:]
+                        if _IS_WINDOWS_SEP:
+                            rel = native.translate(_BS_TO_FS)
                         result[rel] = FileStat(
                             rel_path=rel,
                             size_bytes=st.st_size,
                             mtime_ns=st.st_mtime_ns,
+                            native_rel=native,
+                            st_dev=st.st_dev,
+                            st_ino=st.st_ino,
                         )
                     except OSError:
                         pass
                 elif entry.is_dir(follow_symlinks=True):
-                    if entry.name not in SCAN_EXCLUDE_DIRS:
+                    if not is_excluded_dir(entry.name):
                         subdirs.append(entry.path)
     except OSError:
         return result
@@ -70,7 +113,7 @@ def scan_tree(root: str, cancel_check=None) -> dict[str, FileStat]:
     def _scan_subdir(subdir: str) -> dict[str, FileStat]:
         sub: dict[str, FileStat] = {}
         visited: set[str] = set()
-        _walk(root, subdir, sub, cancel_check, visited)
+        _walk(prefix_len, subdir, sub, cancel_check, visited)
         return sub
 
     workers = min(SCAN_WORKERS, len(subdirs))
@@ -87,39 +130,110 @@ def scan_tree(root: str, cancel_check=None) -> dict[str, FileStat]:
     return result
 
 
-def _walk(base: str, current: str, result: dict, cancel_check, visited: set) -> None:
-    """Recursively walk *current*, appending FileStat entries to *result*."""
-    if cancel_check and cancel_check():
-        return
+def stat_subset(root: str, rel_stats: dict[str, FileStat],
+                cancel_check=None) -> dict[str, FileStat]:
+    """Stat only the paths from *rel_stats* under *root*.
+
+    For a plain one-way sync the planner never looks at destination files
+    that don't exist on the source, so statting the source's rel paths
+    directly beats walking the whole destination tree — especially when the
+    destination drive holds much more than this source. Missing files are
+    simply absent from the result, same as a full scan.
+    """
+    result: dict[str, FileStat] = {}
+    if not rel_stats:
+        return result
+
+    join = os.path.join
 
+    def _stat_one(item) -> Optional[FileStat]:
+        rel, src_stat = item
+        nrel = src_stat.native_rel or rel.replace("/", os.sep)
+        try:
+            st = os.stat(join(root, nrel))
+        except OSError:
+            return None
+        return FileStat(
+            rel_path=rel,
+            size_bytes=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            native_rel=nrel,
+            st_dev=st.st_dev,
+            st_ino=st.st_ino,
+        )
+
+    items = list(rel_stats.items())
+    workers = min(SCAN_WORKERS, max(1, len(items) // 256))
+    if workers <= 1:
+        for item in items:
+            if cancel_check and cancel_check():
+                break
+            fs = _stat_one(item)
+            if fs is not None:
+                result[fs.rel_path] = fs
+        return result
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scanner") as ex:
+        for fs in ex.map(_stat_one, items):
+            if cancel_check and cancel_check():
+                break
+            if fs is not None:
+                result[fs.rel_path] = fs
+    return result
+
+
+def _walk(prefix_len: int, start: str, result: dict, cancel_check, visited: set) -> None:
+    """Iteratively walk *start*, appending FileStat entries to *result*.
+
+    prefix_len: computed once per scan from the root (see _prefix_len); rel
+    paths are entry.path with that prefix sliced off.
+
+    Uses an explicit stack instead of recursion — no Python frame per
+    directory level. Cycle detection resolves realpath only for directories
+    reached through a symlink/junction, skipping the realpath syscall for the
+    overwhelmingly common plain-directory case.
+    """
     try:
-        real = os.path.realpath(current)
+        visited.add(os.path.realpath(start))
     except OSError:
         return
-    if real in visited:
-        return
-    visited.add(real)
-
-    try:
-        with os.scandir(current) as it:
+    stack = [start]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        if cancel_check and cancel_check():
+            return
+        current = pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
             for entry in it:
                 if cancel_check and cancel_check():
                     return
-                if entry.is_file(follow_symlinks=True):
-                    try:
+                try:
+                    if entry.is_file(follow_symlinks=True):
                         st = entry.stat(follow_symlinks=True)
-                        rel = os.path.relpath(entry.path, base).replace("\\", "/")
+                        rel = native = entry.path[prefix_len:]
+                        if _IS_WINDOWS_SEP:
+                            rel = native.translate(_BS_TO_FS)
                         result[rel] = FileStat(
                             rel_path=rel,
                             size_bytes=st.st_size,
                             mtime_ns=st.st_mtime_ns,
+                            native_rel=native,
+                            st_dev=st.st_dev,
+                            st_ino=st.st_ino,
                         )
-                    except OSError:
-                        pass
-                elif entry.is_dir(follow_symlinks=True):
-                    if entry.name not in SCAN_EXCLUDE_DIRS:
-                        _walk(base, entry.path, result, cancel_check, visited)
-    except PermissionError:
-        pass
-    except OSError:
-        pass
+                    elif entry.is_dir(follow_symlinks=True):
+                        if is_excluded_dir(entry.name):
+                            continue
+                        if _is_link(entry):
+                            real = os.path.realpath(entry.path)
+                            if real in visited:
+                                continue
+                            visited.add(real)
+                        push(entry.path)
+                except OSError:
+                    pass
@@ -1,22 +1,42 @@
 """Orchestrates a single source folder to one destination folder sync job."""
 import os
 import threading
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from core.scanner import scan_tree
+from core.scanner import scan_tree, stat_subset
 from core.comparator import compare_trees
-from core.file_ops import atomic_copy, safe_delete, _CancelledError
+from core.file_ops import atomic_copy, copy_batch, safe_delete, _CancelledError
 from db.models import SyncHistory, FileState
 from db.repository import FileStateRepository, HistoryRepository
 from utils import events
-from utils.config import COPY_WORKERS
+from utils.config import COPY_WORKERS, SMALL_FILE_THRESHOLD, SMALL_COPY_BATCH
 from utils.logger import get_logger
 
 log = get_logger("synctool.engine")
 
+_UTC = timezone.utc
+
+
+def _utc_now_iso() -> str:
+    """ISO-8601 UTC timestamp; tzinfo bound once at module level."""
+    return datetime.now(_UTC).isoformat()
+
+
+def _bucket_small_ops(ops: list) -> list:
+    """Group small-file copy ops by destination directory, capped per batch."""
+    by_dir: dict[str, list] = {}
+    for op in ops:
+        by_dir.setdefault(os.path.dirname(op[1]), []).append(op)
+    batches = []
+    for dir_ops in by_dir.values():
+        for i in range(0, len(dir_ops), SMALL_COPY_BATCH):
+            batches.append(dir_ops[i:i + SMALL_COPY_BATCH])
+    return batches
+
 
 class SyncEngine:
     """Syncs one source folder to one destination folder on one drive."""
@@ -43,8 +63,25 @@ class SyncEngine:
         self._file_state_repo = FileStateRepository()
         self._history_repo = HistoryRepository()
         self._history: Optional[SyncHistory] = None
+        self._pending_entries: list = []
+        # Bound once: every cancellation check costs a single C-level call
+        # instead of a Python wrapper frame around Event.is_set. These fire
+        # three times per file plus once per progress tick.
+        self._is_cancelled = cancel_event.is_set
+        self._cancel_check = cancel_event.is_set
+
+    def prepare(self):
+        """Scan both trees and build the sync plan.
 
-    def run(self) -> None:
+        Exposed separately from run() so callers can overlap the scan of the
+        next source with the copy phase of the current one (see
+        ParallelSyncManager._run_job). May raise _CancelledError.
+        """
+        return self._build_plan()
+
+    def run(self, plan_future=None) -> None:
+        """Execute the sync. plan_future, when given, is a Future holding a
+        plan from prepare(); otherwise the trees are scanned here."""
         self._history = self._history_repo.create(
             SyncHistory(
                 id=None,
@@ -52,7 +89,7 @@ class SyncEngine:
                 drive_serial=self.drive_serial,
                 drive_label=self.drive_label,
                 dest_path=self.dest_path,
-                started_at=datetime.now(timezone.utc).isoformat(),
+                started_at=_utc_now_iso(),
                 finished_at=None,
                 status="running",
             )
@@ -60,7 +97,7 @@ class SyncEngine:
         events.put(events.LogEvent("info", f"[{self._tag()}] Scanning..."))
 
         try:
-            plan = self._build_plan()
+            plan = plan_future.result() if plan_future else self._build_plan()
             if self._is_cancelled():
                 self._finish("cancelled")
                 return
@@ -76,25 +113,35 @@ class SyncEngine:
         status = "cancelled" if self._is_cancelled() else "completed"
         self._finish(status)
 
-    def _is_cancelled(self) -> bool:
-        return self.cancel_event.is_set()
-
-    def _cancel_check(self) -> bool:
-        return self.cancel_event.is_set()
-
     def _tag(self) -> str:
         src_name = os.path.basename(self.source_path) or self.source_path
         letter = self.dest_path[:3] if len(self.dest_path) >= 3 else self.drive_label
         return letter + "\\" + src_name
 
     def _build_plan(self):
-        events.put(events.LogEvent("info", f"[{self._tag()}] Scanning source..."))
-        src_stats = scan_tree(self.source_path, cancel_check=self._cancel_check)
-        if self._is_cancelled():
-            raise _CancelledError()
-
-        events.put(events.LogEvent("info", f"[{self._tag()}] Scanning destination..."))
-        dst_stats = scan_tree(self.dest_path, cancel_check=self._cancel_check)
+        if self.direction == "source_to_dest" and not self.delete_extraneous:
+            # Plain one-way: only destination files matching the source are
+            # ever compared, so stat those directly instead of walking the
+            # whole destination drive. (The subset depends on the source
+            # scan, so these two phases can't overlap.)
+            events.put(events.LogEvent("info", f"[{self._tag()}] Scanning source..."))
+            src_stats = scan_tree(self.source_path, cancel_check=self._cancel_check)
+            if self._is_cancelled():
+                raise _CancelledError()
+            events.put(events.LogEvent("info", f"[{self._tag()}] Scanning destination..."))
+            dst_stats = stat_subset(self.dest_path, src_stats,
+                                    cancel_check=self._cancel_check)
+        else:
+            # Source and destination live on different devices, so their
+            # full walks overlap instead of running back to back.
+            events.put(events.LogEvent("info", f"[{self._tag()}] Scanning source and destination..."))
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="scan") as ex:
+                f_src = ex.submit(scan_tree, self.source_path,
+                                  cancel_check=self._cancel_check)
+                f_dst = ex.submit(scan_tree, self.dest_path,
+                                  cancel_check=self._cancel_check)
+                src_stats = f_src.result()
+                dst_stats = f_dst.result()
         if self._is_cancelled():
             raise _CancelledError()
 
@@ -109,8 +156,8 @@ class SyncEngine:
 
         known_src, known_dst = {}, {}
         if self.direction == "bidirectional":
-            known_src = self._file_state_repo.get_states(self.source_path, "SOURCE")
-            known_dst = self._file_state_repo.get_states(self.source_path, self.drive_serial)
+            known_src, known_dst = self._file_state_repo.get_states_pair(
+                self.source_path, "SOURCE", self.drive_serial)
 
         plan = compare_trees(
             src_root=src_root,
@@ -133,18 +180,29 @@ class SyncEngine:
 
     def _execute_plan(self, plan) -> None:
         all_ops = (
-            [(src, dst, rel, sz, "copy") for src, dst, rel, sz in plan.to_copy]
-            + [(src, dst, rel, sz, "conflict") for src, dst, rel, sz in plan.conflicts]
+            [op + ("copy",) for op in plan.to_copy]
+            + [op + ("conflict",) for op in plan.conflicts]
         )
         total_files = len(all_ops) + len(plan.to_delete) + len(plan.to_skip)
-        total_bytes = sum(sz for _, _, _, sz, _ in all_ops)
+        total_bytes = sum(op[3] for op in all_ops)
 
         # Shared mutable counters — accessed from multiple copy worker threads.
         _lock = threading.Lock()
         _done = [0, 0]          # [files_done, bytes_done]
         history_entries: list = []
+        copied_ok: list = []    # ops that completed — feeds _update_file_states
 
-        def _emit(current_file: str = "") -> None:
+        # Progress emissions are rate-limited to ~30 Hz: a fast copy would
+        # otherwise post thousands of ProgressEvents per second that the Tk
+        # consumer must allocate, dequeue and discard. Per-file completion
+        # ticks are forced so files_done never skips a row in the UI.
+        _last_emit = [0.0]
+
+        def _emit(current_file: str = "", force: bool = False) -> None:
+            now = time.monotonic()
+            if not force and now - _last_emit[0] < 0.033:
+                return
+            _last_emit[0] = now
             events.put(events.ProgressEvent(
                 drive_serial=self.drive_serial,
                 files_done=_done[0],
@@ -154,25 +212,17 @@ class SyncEngine:
                 current_file=current_file,
             ))
 
-        _emit()
+        _emit(force=True)
 
-        def _copy_one(op: tuple) -> None:
-            """Copy one file; called from a worker thread."""
-            src_abs, dst_abs, rel, size_bytes, action = op
-            if self._is_cancelled():
-                return
-
-            def _progress(n: int) -> None:
-                with _lock:
-                    _done[1] += n
-                _emit(rel)
-
-            try:
-                atomic_copy(src_abs, dst_abs, progress_cb=_progress,
-                            cancel_check=self._cancel_check)
+        def _record_done(op: tuple, exc: Optional[Exception]) -> None:
+            """Book-keeping shared by the single-file and batch copy paths."""
+            src_abs, dst_abs, rel, size_bytes, mtime_ns, action = op
+            if exc is None:
                 with _lock:
                     _done[0] += 1
                     history_entries.append((rel, action, size_bytes, ""))
+                    if action == "copy":
+                        copied_ok.append(op)
                     if self._history:
                         self._history.files_copied += 1
                         self._history.bytes_copied += size_bytes
@@ -180,9 +230,7 @@ class SyncEngine:
                     drive_serial=self.drive_serial, rel_path=rel,
                     action=action, size_bytes=size_bytes,
                 ))
-            except _CancelledError:
-                raise
-            except Exception as exc:
+            else:
                 log.error("Copy failed %s: %s", src_abs, exc)
                 with _lock:
                     _done[0] += 1
@@ -191,19 +239,70 @@ class SyncEngine:
                     drive_serial=self.drive_serial, rel_path=rel,
                     action="error", size_bytes=size_bytes, error_msg=str(exc),
                 ))
-            _emit(rel)
+            _emit(rel, force=True)
+
+        def _copy_one(op: tuple) -> None:
+            """Copy one large file; called from a worker thread."""
+            src_abs, dst_abs, rel, size_bytes, mtime_ns, action = op
+            if self._is_cancelled():
+                return
+
+            def _progress(n: int) -> None:
+                with _lock:
+                    _done[1] += n
+                _emit(rel)
+
+            try:
+                atomic_copy(src_abs, dst_abs, progress_cb=_progress,
+                            cancel_check=self._cancel_check)
+            except _CancelledError:
+                raise
+            except Exception as exc:
+                _record_done(op, exc)
+                return
+            _record_done(op, None)
+
+        def _copy_small_batch(batch: list) -> None:
+            """Copy one directory bucket of small files; called from a worker thread."""
+            if self._is_cancelled():
+                return
+            op_by_pair = {(op[0], op[1]): op for op in batch}
+
+            def _one_done(src_abs: str, dst_abs: str, exc) -> None:
+                op = op_by_pair[(src_abs, dst_abs)]
+                if exc is None:
+                    with _lock:
+                        _done[1] += op[3]
+                _record_done(op, exc)
+
+            copy_batch(
+                [(op[0], op[1]) for op in batch],
+                cancel_check=self._cancel_check,
+                on_file_done=_one_done,
+            )
 
         # ── Parallel copy phase ──────────────────────────────────────────────
+        # Small files are batched per destination directory to amortize
+        # makedirs/open overhead; large files stream through atomic_copy.
         if all_ops:
-            workers = min(COPY_WORKERS, len(all_ops))
+            large_ops = [op for op in all_ops if op[3] >= SMALL_FILE_THRESHOLD]
+            small_ops = [op for op in all_ops if op[3] < SMALL_FILE_THRESHOLD]
+            batches = _bucket_small_ops(small_ops)
+            n_tasks = len(large_ops) + len(batches)
+            workers = min(COPY_WORKERS, n_tasks)
             with ThreadPoolExecutor(max_workers=workers,
                                     thread_name_prefix="copy") as ex:
-                futs = {ex.submit(_copy_one, op): op for op in all_ops}
+                futs = {ex.submit(_copy_one, op): op for op in large_ops}
+                futs.update({ex.submit(_copy_small_batch, b): b for b in batches})
                 for fut in as_completed(futs):
                     try:
                         fut.result()
                     except _CancelledError:
                         self.cancel_event.set()
+                        # Drop everything not yet started so shutdown only
+                        # waits on tasks already in flight.
+                        for pending in futs:
+                            pending.cancel()
                         break
             # Workers that were still running when we broke out of the loop
             # will finish their current chunk quickly (cancel_check fires per chunk).
@@ -211,54 +310,70 @@ class SyncEngine:
         if self._is_cancelled():
             raise _CancelledError()
 
+        # Locals hoisted for the sequential per-file loops below — at 100K+
+        # entries the repeated attribute chains cost more than the loop body.
+        put = events.put
+        file_event = events.FileActionEvent
+        entry_append = history_entries.append
+        is_cancelled = self.cancel_event.is_set
+        drive_serial = self.drive_serial
+
         # ── Deletes (sequential — fast, no benefit from parallelism) ─────────
-        for dst_abs in plan.to_delete:
-            if self._is_cancelled():
+        # rel comes straight from the plan: the comparator already knew it
+        # when it marked the entry extraneous, so no relpath walk per file.
+        for dst_abs, rel in plan.to_delete:
+            if is_cancelled():
                 raise _CancelledError()
-            rel = os.path.relpath(dst_abs, self.dest_path).replace("\\", "/")
             safe_delete(dst_abs)
-            history_entries.append((rel, "delete", 0, ""))
+            entry_append((rel, "delete", 0, ""))
             _done[0] += 1
-            events.put(events.FileActionEvent(
-                drive_serial=self.drive_serial, rel_path=rel,
+            put(file_event(
+                drive_serial=drive_serial, rel_path=rel,
                 action="delete", size_bytes=0,
             ))
             _emit(rel)
 
         # ── Skips ─────────────────────────────────────────────────────────────
-        for src_abs, dst_abs, rel, size_bytes in plan.to_skip:
-            if self._is_cancelled():
+        for src_abs, dst_abs, rel, size_bytes, _mtime in plan.to_skip:
+            if is_cancelled():
                 raise _CancelledError()
-            events.put(events.FileActionEvent(
-                drive_serial=self.drive_serial, rel_path=rel,
+            put(file_event(
+                drive_serial=drive_serial, rel_path=rel,
                 action="skip", size_bytes=size_bytes,
             ))
             _done[0] += 1
             _emit(rel)
 
-        self._update_file_states(plan)
-        if self._history and history_entries:
-            self._history_repo.add_file_entries(self._history.id, history_entries)
+        # Final tick — the rate limiter may have swallowed the last updates.
+        _emit(force=True)
 
-    def _update_file_states(self, plan) -> None:
+        self._update_file_states(copied_ok)
+        # Written together with the final history row in _finish (single
+        # closing transaction).
+        self._pending_entries = history_entries
+
+    def _update_file_states(self, copied_ops: list) -> None:
+        """Record post-sync state for bidirectional diffing.
+
+        Uses the size/mtime already carried by the plan entries: atomic_copy
+        preserves the source mtime via copystat, so both sides match the
+        in-memory values and no per-file os.stat is needed. Only ops that
+        actually completed are recorded.
+        """
         if self.direction != "bidirectional":
             return
         states = []
-        for src_abs, dst_abs, rel, *_ in plan.to_copy:
-            for path, serial in [(dst_abs, self.drive_serial), (src_abs, "SOURCE")]:
-                try:
-                    st = os.stat(path)
-                    states.append(FileState(
-                        id=None,
-                        source_path=self.source_path,
-                        drive_serial=serial,
-                        rel_path=rel,
-                        size_bytes=st.st_size,
-                        mtime_ns=st.st_mtime_ns,
-                        sha256=None,
-                    ))
-                except OSError:
-                    pass
+        for src_abs, dst_abs, rel, size_bytes, mtime_ns, _action in copied_ops:
+            for serial in (self.drive_serial, "SOURCE"):
+                states.append(FileState(
+                    id=None,
+                    source_path=self.source_path,
+                    drive_serial=serial,
+                    rel_path=rel,
+                    size_bytes=size_bytes,
+                    mtime_ns=mtime_ns,
+                    sha256=None,
+                ))
         if states:
             self._file_state_repo.upsert_batch(states)
 
@@ -266,9 +381,11 @@ class SyncEngine:
         if self._history is None:
             return
         self._history.status = status
-        self._history.finished_at = datetime.now(timezone.utc).isoformat()
+        self._history.finished_at = _utc_now_iso()
         self._history.error_message = error_message
-        self._history_repo.update(self._history)
+        entries = self._pending_entries
+        self._pending_entries = []
+        self._history_repo.finalize(self._history, entries)
         events.put(events.SyncCompleteEvent(
             drive_serial=self.drive_serial,
             status=status,
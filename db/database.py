@@ -1,13 +1,28 @@
-"""SQLite connection manager with WAL mode and thread-safe locking."""
+"""SQLite connection manager: WAL mode with one connection per thread."""
 import sqlite3
 import threading
 from utils.config import DB_PATH
 
-_conn: sqlite3.Connection | None = None
-_lock = threading.Lock()
+# Each thread gets its own connection (created lazily in get_conn). Under
+# WAL, SQLite itself allows many concurrent readers plus one writer, so
+# there is no Python-level lock: copy workers and UI reads no longer
+# serialize through a single shared connection. busy_timeout covers the
+# rare writer-vs-writer collision. _all_conns tracks every connection for
+# close() as (owning thread, connection) pairs: worker pools are per-run,
+# so entries whose thread has exited are closed and pruned on the next
+# get_conn — sqlite3.Connection cannot be weakly referenced, or a WeakSet
+# would do this for free. Without the pruning every sync run would strand
+# connections (an fd plus a 64 MB page cache each) until process exit.
+_tls = threading.local()
+_all_conns: list = []
+_conns_lock = threading.Lock()
+_schema_done = False
 
 SCHEMA = """
 PRAGMA journal_mode=WAL;
+-- NORMAL is durable enough under WAL (no torn transactions on app crash)
+-- and skips the per-commit fsync that FULL pays.
+PRAGMA synchronous=NORMAL;
 PRAGMA foreign_keys=ON;
 
 -- Key/value store for app settings and last session
@@ -16,6 +31,19 @@ CREATE TABLE IF NOT EXISTS settings (
     value TEXT NOT NULL DEFAULT ''
 );
 
+-- Last-session selections as real rows (no JSON round trip on start/close)
+CREATE TABLE IF NOT EXISTS session_sources (
+    idx  INTEGER PRIMARY KEY,
+    path TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS session_drives (
+    idx       INTEGER PRIMARY KEY,
+    serial    TEXT NOT NULL,
+    label     TEXT NOT NULL DEFAULT '',
+    letter    TEXT NOT NULL DEFAULT '',
+    dest_root TEXT NOT NULL DEFAULT ''
+);
+
 -- Per-file state recorded after a successful sync (used by bidirectional mode)
 CREATE TABLE IF NOT EXISTS file_states (
     id           INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -60,33 +88,67 @@ CREATE INDEX IF NOT EXISTS idx_history_files
 """
 
 
+def _new_conn() -> sqlite3.Connection:
+    # cached_statements: the repositories reuse a small set of SQL strings
+    # (hoisted to module constants), so a larger prepared-statement cache
+    # means the parser runs once per statement per connection, not per call.
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False,
+                           cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    # journal_mode/synchronous persist in the DB file via the schema script;
+    # these are per-connection.
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    return conn
+
+
 def initialize() -> None:
     """Create tables if they don't exist. Call once at startup."""
-    global _conn
-    with _lock:
-        if _conn is None:
-            _conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-            _conn.row_factory = sqlite3.Row
-        _conn.executescript(SCHEMA)
-        _conn.commit()
-
-
-def get_conn() -> tuple[sqlite3.Connection, threading.Lock]:
-    """Return the shared connection and its lock.
-
-    Callers must acquire the lock before every execute:
-        conn, lock = get_conn()
-        with lock:
-            conn.execute(...)
-    """
-    if _conn is None:
+    global _schema_done
+    conn = get_conn()
+    if not _schema_done:
+        conn.executescript(SCHEMA)
+        conn.commit()
+        _schema_done = True
+
+
+def _prune_dead_locked() -> None:
+    # Caller holds _conns_lock. Connections whose owning thread has exited
+    # can never be used again (get_conn is strictly thread-local), so
+    # closing them from here is safe.
+    live = []
+    for thread, conn in _all_conns:
+        if thread.is_alive():
+            live.append((thread, conn))
+        else:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+    _all_conns[:] = live
+
+
+def get_conn() -> sqlite3.Connection:
+    """Return this thread's connection, creating it on first use."""
+    conn = getattr(_tls, "conn", None)
+    if conn is None:
+        conn = _tls.conn = _new_conn()
+        with _conns_lock:
+            _prune_dead_locked()
+            _all_conns.append((threading.current_thread(), conn))
         initialize()
-    return _conn, _lock
+    return conn
 
 
 def close() -> None:
-    global _conn
-    with _lock:
-        if _conn:
-            _conn.close()
-            _conn = None
+    """Close every connection created so far (app shutdown)."""
+    with _conns_lock:
+        conns = [conn for _thread, conn in _all_conns]
+        _all_conns.clear()
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    _tls.conn = None
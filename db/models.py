@@ -10,6 +10,9 @@ class DriveInfo:
     serial: str          # hex volume serial
     drive_type: int      # Windows DRIVE_TYPE constant
     free_bytes: int = 0
+    # Suggested destination folder (e.g. "E:\\SyncBackup"); filled in by the
+    # drive detector so the UI never joins paths on combobox events.
+    default_dest_root: str = ""
 
     @property
     def display_name(self) -> str:
@@ -45,20 +48,32 @@ class DriveJob:
     delete_extraneous: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileStat:
+    """One per scanned file; slots+frozen keeps the per-instance footprint
+    small (no __dict__) since million-file trees allocate one of these each."""
     rel_path: str
     size_bytes: int
     mtime_ns: int
     sha256: Optional[str] = None
+    # rel_path with native separators, captured at scan time (the scanner has
+    # it for free). Same string object as rel_path on POSIX. Saves the
+    # planners a str.replace per file per side.
+    native_rel: str = ""
+    # Device/inode identity from the scan stat. When both sides of a compare
+    # share them the files are literally the same object (hardlink or the
+    # same path reached twice) and hashing can be skipped. 0 = unknown
+    # (some Windows filesystems report st_ino == 0).
+    st_dev: int = 0
+    st_ino: int = 0
 
 
 @dataclass
 class SyncPlan:
-    to_copy: list = field(default_factory=list)      # (src_abs, dst_abs, rel_path, size_bytes)
-    to_delete: list = field(default_factory=list)    # dst_abs strings
-    conflicts: list = field(default_factory=list)    # (src_abs, conflict_dst_abs, rel_path, size_bytes)
-    to_skip: list = field(default_factory=list)      # (src_abs, dst_abs, rel_path, size_bytes)
+    to_copy: list = field(default_factory=list)      # (src_abs, dst_abs, rel_path, size_bytes, mtime_ns)
+    to_delete: list = field(default_factory=list)    # (dst_abs, rel_path)
+    conflicts: list = field(default_factory=list)    # (src_abs, conflict_dst_abs, rel_path, size_bytes, mtime_ns)
+    to_skip: list = field(default_factory=list)      # (src_abs, dst_abs, rel_path, size_bytes, mtime_ns)
 
 
 @dataclass
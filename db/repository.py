@@ -1,28 +1,48 @@
 """CRUD operations for all database entities."""
-import json
 import sqlite3
 from typing import Optional
 from db.database import get_conn
 from db.models import FileState, SyncHistory, SyncDrive
 
+# Hot-path SQL hoisted to module constants: passing the same string object
+# every call guarantees a hit in the connection's prepared-statement cache
+# instead of re-tokenizing the text per batch.
+_UPSERT_FILE_STATE_SQL = """INSERT INTO file_states (source_path, drive_serial, rel_path, size_bytes, mtime_ns, sha256)
+   VALUES (?, ?, ?, ?, ?, ?)
+   ON CONFLICT(source_path, drive_serial, rel_path)
+   DO UPDATE SET size_bytes=excluded.size_bytes,
+                 mtime_ns=excluded.mtime_ns,
+                 sha256=excluded.sha256,
+                 synced_at=datetime('now')"""
+
+_INSERT_HISTORY_SQL = """INSERT INTO sync_history
+   (source_path, drive_serial, drive_label, dest_path, started_at, status)
+   VALUES (?, ?, ?, ?, ?, 'running')"""
+
+_UPDATE_HISTORY_SQL = """UPDATE sync_history
+   SET finished_at=?, status=?, files_copied=?, bytes_copied=?, error_message=?
+   WHERE id=?"""
+
+_INSERT_HISTORY_FILE_SQL = """INSERT INTO sync_history_files (history_id, rel_path, action, size_bytes, error_msg)
+   VALUES (?, ?, ?, ?, ?)"""
+
 
 class SettingsRepository:
     """Key/value settings store — also persists the last used session."""
 
     def get(self, key: str, default: str = "") -> str:
-        conn, lock = get_conn()
-        with lock:
-            row = conn.execute("SELECT value FROM settings WHERE key=?", (key,)).fetchone()
+        row = get_conn().execute(
+            "SELECT value FROM settings WHERE key=?", (key,)
+        ).fetchone()
         return row["value"] if row else default
 
     def set(self, key: str, value: str) -> None:
-        conn, lock = get_conn()
-        with lock:
-            conn.execute(
-                "INSERT INTO settings(key, value) VALUES(?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-                (key, value),
-            )
-            conn.commit()
+        conn = get_conn()
+        conn.execute(
+            "INSERT INTO settings(key, value) VALUES(?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+            (key, value),
+        )
+        conn.commit()
 
     def save_session(
         self,
@@ -32,35 +52,41 @@ class SettingsRepository:
         use_hash: bool,
         delete_extraneous: bool,
     ) -> None:
-        drives_data = [
-            {"serial": d.drive_serial, "label": d.drive_label,
-             "letter": d.drive_letter, "dest_root": d.dest_root}
-            for d in drives
-        ]
-        self.set("last_sources", json.dumps(sources))
-        self.set("last_drives", json.dumps(drives_data))
+        # Sources and drives go into real rows (see session_* tables) —
+        # no JSON serialisation, and one transaction for the whole swap.
+        conn = get_conn()
+        conn.execute("DELETE FROM session_sources")
+        conn.execute("DELETE FROM session_drives")
+        conn.executemany(
+            "INSERT INTO session_sources(idx, path) VALUES (?, ?)",
+            list(enumerate(sources)),
+        )
+        conn.executemany(
+            "INSERT INTO session_drives(idx, serial, label, letter, dest_root) VALUES (?, ?, ?, ?, ?)",
+            [(i, d.drive_serial, d.drive_label, d.drive_letter, d.dest_root)
+             for i, d in enumerate(drives)],
+        )
+        conn.commit()
         self.set("direction", direction)
         self.set("use_hash", "1" if use_hash else "0")
         self.set("delete_extraneous", "1" if delete_extraneous else "0")
 
     def load_session(self) -> dict:
-        try:
-            sources = json.loads(self.get("last_sources", "[]"))
-        except Exception:
-            sources = []
-        try:
-            drives_data = json.loads(self.get("last_drives", "[]"))
-            drives = [
-                SyncDrive(
-                    drive_serial=d["serial"],
-                    drive_label=d["label"],
-                    drive_letter=d["letter"],
-                    dest_root=d["dest_root"],
-                )
-                for d in drives_data
-            ]
-        except Exception:
-            drives = []
+        conn = get_conn()
+        sources = [
+            r["path"] for r in conn.execute(
+                "SELECT path FROM session_sources ORDER BY idx").fetchall()
+        ]
+        drives = [
+            SyncDrive(
+                drive_serial=r["serial"],
+                drive_label=r["label"],
+                drive_letter=r["letter"],
+                dest_root=r["dest_root"],
+            )
+            for r in conn.execute(
+                "SELECT * FROM session_drives ORDER BY idx").fetchall()
+        ]
         return {
             "sources": sources,
             "drives": drives,
@@ -73,12 +99,10 @@ class SettingsRepository:
 class FileStateRepository:
     def get_states(self, source_path: str, drive_serial: str) -> dict:
         """Return {rel_path: FileState} for the given source+drive."""
-        conn, lock = get_conn()
-        with lock:
-            rows = conn.execute(
-                "SELECT * FROM file_states WHERE source_path=? AND drive_serial=?",
-                (source_path, drive_serial),
-            ).fetchall()
+        rows = get_conn().execute(
+            "SELECT * FROM file_states WHERE source_path=? AND drive_serial=?",
+            (source_path, drive_serial),
+        ).fetchall()
         return {
             r["rel_path"]: FileState(
                 id=r["id"],
@@ -92,58 +116,70 @@ class FileStateRepository:
             for r in rows
         }
 
+    def get_states_pair(self, source_path: str, serial_a: str,
+                        serial_b: str) -> tuple[dict, dict]:
+        """Return ({rel: FileState} for serial_a, same for serial_b).
+
+        One query with an IN predicate instead of two round trips; the
+        composite index covers (source_path, drive_serial) as its leading
+        columns, so both slices come off the same index walk.
+        """
+        rows = get_conn().execute(
+            "SELECT * FROM file_states WHERE source_path=? AND drive_serial IN (?, ?)",
+            (source_path, serial_a, serial_b),
+        ).fetchall()
+        a: dict = {}
+        b: dict = {}
+        for r in rows:
+            state = FileState(
+                id=r["id"],
+                source_path=r["source_path"],
+                drive_serial=r["drive_serial"],
+                rel_path=r["rel_path"],
+                size_bytes=r["size_bytes"],
+                mtime_ns=r["mtime_ns"],
+                sha256=r["sha256"],
+            )
+            (a if r["drive_serial"] == serial_a else b)[r["rel_path"]] = state
+        return a, b
+
     def upsert_batch(self, states: list) -> None:
         if not states:
             return
-        conn, lock = get_conn()
-        with lock:
-            conn.executemany(
-                """INSERT INTO file_states (source_path, drive_serial, rel_path, size_bytes, mtime_ns, sha256)
-                   VALUES (?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(source_path, drive_serial, rel_path)
-                   DO UPDATE SET size_bytes=excluded.size_bytes,
-                                 mtime_ns=excluded.mtime_ns,
-                                 sha256=excluded.sha256,
-                                 synced_at=datetime('now')""",
-                [(s.source_path, s.drive_serial, s.rel_path, s.size_bytes, s.mtime_ns, s.sha256)
-                 for s in states],
-            )
-            conn.commit()
+        conn = get_conn()
+        conn.executemany(
+            _UPSERT_FILE_STATE_SQL,
+            ((s.source_path, s.drive_serial, s.rel_path, s.size_bytes, s.mtime_ns, s.sha256)
+             for s in states),
+        )
+        conn.commit()
 
 
 class HistoryRepository:
     def create(self, history: SyncHistory) -> SyncHistory:
-        conn, lock = get_conn()
-        with lock:
-            cur = conn.execute(
-                """INSERT INTO sync_history
-                   (source_path, drive_serial, drive_label, dest_path, started_at, status)
-                   VALUES (?, ?, ?, ?, ?, 'running')""",
-                (history.source_path, history.drive_serial,
-                 history.drive_label, history.dest_path, history.started_at),
-            )
-            conn.commit()
-            history.id = cur.lastrowid
+        conn = get_conn()
+        cur = conn.execute(
+            _INSERT_HISTORY_SQL,
+            (history.source_path, history.drive_serial,
+             history.drive_label, history.dest_path, history.started_at),
+        )
+        conn.commit()
+        history.id = cur.lastrowid
         return history
 
     def update(self, history: SyncHistory) -> None:
-        conn, lock = get_conn()
-        with lock:
-            conn.execute(
-                """UPDATE sync_history
-                   SET finished_at=?, status=?, files_copied=?, bytes_copied=?, error_message=?
-                   WHERE id=?""",
-                (history.finished_at, history.status, history.files_copied,
-                 history.bytes_copied, history.error_message, history.id),
-            )
-            conn.commit()
+        conn = get_conn()
+        conn.execute(
+            _UPDATE_HISTORY_SQL,
+            (history.finished_at, history.status, history.files_copied,
+             history.bytes_copied, history.error_message, history.id),
+        )
+        conn.commit()
 
     def list_recent(self, limit: int = 200) -> list:
-        conn, lock = get_conn()
-        with lock:
-            rows = conn.execute(
-                "SELECT * FROM sync_history ORDER BY started_at DESC LIMIT ?", (limit,)
-            ).fetchall()
+        rows = get_conn().execute(
+            "SELECT * FROM sync_history ORDER BY started_at DESC LIMIT ?", (limit,)
+        ).fetchall()
         return [self._row_to_model(r) for r in rows]
 
     def _row_to_model(self, r) -> SyncHistory:
@@ -161,30 +197,58 @@ class HistoryRepository:
             error_message=r["error_message"],
         )
 
+    # Rows inserted per transaction in add_file_entries. Short write
+    # transactions keep the WAL writer slot free for other threads and
+    # let the checkpointer run between chunks on big runs.
+    _FILE_ENTRY_CHUNK = 1000
+
     def add_file_entries(self, history_id: int, entries: list) -> None:
         """entries: list of (rel_path, action, size_bytes, error_msg)"""
         if not entries:
             return
-        conn, lock = get_conn()
-        with lock:
+        conn = get_conn()
+        chunk = self._FILE_ENTRY_CHUNK
+        for i in range(0, len(entries), chunk):
             conn.executemany(
-                """INSERT INTO sync_history_files (history_id, rel_path, action, size_bytes, error_msg)
-                   VALUES (?, ?, ?, ?, ?)""",
-                [(history_id, e[0], e[1], e[2], e[3]) for e in entries],
+                _INSERT_HISTORY_FILE_SQL,
+                ((history_id, e[0], e[1], e[2], e[3])
+                 for e in entries[i:i + chunk]),
             )
             conn.commit()
 
+    def finalize(self, history: SyncHistory, entries: list) -> None:
+        """Write a run's per-file entries plus its final history row.
+
+        The history UPDATE rides in the same transaction as the last chunk
+        of entries, so closing out a run costs one commit (one WAL flush)
+        instead of two.
+        """
+        conn = get_conn()
+        chunk = self._FILE_ENTRY_CHUNK
+        n = len(entries)
+        for i in range(0, n, chunk):
+            conn.executemany(
+                _INSERT_HISTORY_FILE_SQL,
+                ((history.id, e[0], e[1], e[2], e[3])
+                 for e in entries[i:i + chunk]),
+            )
+            if i + chunk < n:
+                conn.commit()
+        conn.execute(
+            _UPDATE_HISTORY_SQL,
+            (history.finished_at, history.status, history.files_copied,
+             history.bytes_copied, history.error_message, history.id),
+        )
+        conn.commit()
+
     def get_file_entries(self, history_id: int) -> list:
-        conn, lock = get_conn()
-        with lock:
-            return conn.execute(
-                "SELECT * FROM sync_history_files WHERE history_id=? ORDER BY id",
-                (history_id,),
-            ).fetchall()
+        return get_conn().execute(
+            "SELECT * FROM sync_history_files WHERE history_id=? ORDER BY id",
+            (history_id,),
+        ).fetchall()
 
     def clear_all(self) -> None:
-        conn, lock = get_conn()
-        with lock:
-            conn.execute("DELETE FROM sync_history_files")
-            conn.execute("DELETE FROM sync_history")
-            conn.commit()
+        conn = get_conn()
+        conn.execute("DELETE FROM sync_history_files")
+        conn.execute("DELETE FROM sync_history")
+        conn.commit()
@@ -1,25 +1,36 @@
 """History tab: shows past sync runs with expandable per-file detail."""
 import os
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from tkinter import ttk, messagebox
 
 from db.repository import HistoryRepository
 
+# History queries run off the Tk thread so a large table never freezes the
+# mainloop; one worker is enough since queries are serialized per panel.
+_db_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-db")
 
+
+@lru_cache(maxsize=4096)
 def _fmt_bytes(n: int) -> str:
-    if n >= 1024 ** 3:
-        return f"{n / 1024**3:.1f} GB"
-    if n >= 1024 ** 2:
-        return f"{n / 1024**2:.1f} MB"
-    if n >= 1024:
-        return f"{n / 1024:.1f} KB"
-    return f"{n} B"
+    # bit_length picks the unit without cascading comparisons, and the cache
+    # pays off on detail loads where many files share the same size.
+    if n < 1024:
+        return f"{n} B"
+    i = min((n.bit_length() - 1) // 10, 3)
+    return f"{n / (1 << (i * 10)):.1f} {('KB', 'MB', 'GB')[i - 1]}"
 
 
 class HistoryPanel(ttk.Frame):
+    # Rows inserted per after_idle slot during refresh — keeps any single
+    # callback short so the mainloop stays responsive with a long history.
+    _INSERT_BATCH = 50
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self._history_repo = HistoryRepository()
+        self._refresh_gen = 0  # invalidates in-flight insert batches
         self._build_ui()
 
     def _build_ui(self):
@@ -75,15 +86,26 @@ class HistoryPanel(ttk.Frame):
         dsb.pack(side="right", fill="y")
         self._detail_tree.pack(side="left", fill="both", expand=True)
 
+    def on_activate(self):
+        """Called by the main window when this tab is selected."""
+        self.refresh()
+
     def refresh(self):
-        self._tree.delete(*self._tree.get_children())
-        for h in self._history_repo.list_recent(limit=200):
+        fut = _db_exec.submit(self._history_repo.list_recent, 200)
+        fut.add_done_callback(
+            lambda f: self.after(0, self._apply_rows, f.result()))
+
+    def _apply_rows(self, histories):
+        # Pre-format every row up front (cheap Python), then feed the
+        # Treeview in small after_idle batches: one giant insert loop stalls
+        # the mainloop on each Tcl round trip when history is long.
+        items = []
+        for h in histories:
             src_name = os.path.basename(h.source_path.rstrip("/\\")) or h.source_path
             dest_name = os.path.basename(h.dest_path.rstrip("/\\")) or h.dest_path
-            self._tree.insert(
-                "", "end",
-                iid=str(h.id),
-                values=(
+            items.append((
+                str(h.id),
+                (
                     h.id,
                     h.started_at[:19].replace("T", " "),
                     src_name,
@@ -93,8 +115,21 @@ class HistoryPanel(ttk.Frame):
                     _fmt_bytes(h.bytes_copied),
                     h.status.upper(),
                 ),
-                tags=(h.status,),
-            )
+                h.status,
+            ))
+        self._refresh_gen += 1
+        self._tree.delete(*self._tree.get_children())
+        self._insert_batch(items, 0, self._refresh_gen)
+
+    def _insert_batch(self, items, start, gen):
+        if gen != self._refresh_gen:
+            return  # superseded by a newer refresh
+        insert = self._tree.insert
+        for iid, values, status in items[start:start + self._INSERT_BATCH]:
+            insert("", "end", iid=iid, values=values, tags=(status,))
+        if start + self._INSERT_BATCH < len(items):
+            self.after_idle(self._insert_batch, items,
+                            start + self._INSERT_BATCH, gen)
 
     def _on_double_click(self, _event):
         sel = self._tree.selection()
@@ -103,8 +138,13 @@ class HistoryPanel(ttk.Frame):
         self._load_detail(int(sel[0]))
 
     def _load_detail(self, history_id: int):
+        fut = _db_exec.submit(self._history_repo.get_file_entries, history_id)
+        fut.add_done_callback(
+            lambda f: self.after(0, self._apply_detail, f.result()))
+
+    def _apply_detail(self, entries):
         self._detail_tree.delete(*self._detail_tree.get_children())
-        for e in self._history_repo.get_file_entries(history_id):
+        for e in entries:
             self._detail_tree.insert(
                 "", "end",
                 values=(e["rel_path"], e["action"].upper(),
@@ -8,6 +8,7 @@ from ui.settings_dialog import SettingsPanel
 from ui.organize_panel import OrganizePanel
 from core.drive_detector import DriveMonitor
 from utils.config import DRIVE_POLL_INTERVAL_MS
+from utils.win_device_notify import start_device_listener
 
 
 class MainWindow(ttk.Frame):
@@ -15,7 +16,21 @@ class MainWindow(ttk.Frame):
         super().__init__(parent, **kwargs)
         self._build_ui()
         self._drive_monitor = DriveMonitor(on_change=self._on_drives_changed)
-        self._schedule_drive_poll()
+        # Skip poll-mode drive checks while the window is withdrawn or
+        # minimized; nothing can react to the result anyway. Iconifying
+        # only unmaps the toplevel — child frames keep their own map
+        # state — so the bindings go on the toplevel, filtered to its own
+        # events (<Unmap>/<Map> propagate down from it to every child).
+        self._polling_paused = False
+        self._toplevel = self.winfo_toplevel()
+        self._toplevel.bind("<Unmap>", self._on_unmap, add="+")
+        self._toplevel.bind("<Map>", self._on_map, add="+")
+        # Prefer event-driven WM_DEVICECHANGE notifications; fall back to
+        # polling where they are unavailable (non-Windows or setup failure).
+        if start_device_listener(self._on_device_event):
+            self._drive_monitor.check()  # populate the initial drive set
+        else:
+            self._schedule_drive_poll()
 
     def _build_ui(self):
         self.pack(fill="both", expand=True)
@@ -23,17 +38,23 @@ class MainWindow(ttk.Frame):
         notebook = ttk.Notebook(self)
         notebook.pack(fill="both", expand=True, padx=4, pady=4)
 
+        # Tab activation is dispatched by tab id, mapped once here — no Tcl
+        # text query or string compare per tab switch.
+        self._tab_callbacks = {}
+
         self._sync_panel = SyncPanel(notebook)
         notebook.add(self._sync_panel, text="  Sync  ")
 
         self._history_panel = HistoryPanel(notebook)
         notebook.add(self._history_panel, text="  History  ")
+        self._tab_callbacks[notebook.tabs()[-1]] = self._history_panel.on_activate
 
         self._settings_panel = SettingsPanel(notebook)
         notebook.add(self._settings_panel, text="  Settings  ")
 
         self._organize_panel = OrganizePanel(notebook)
         notebook.add(self._organize_panel, text="  Organise  ")
+        self._organize_tab_id = notebook.tabs()[-1]
 
         # Wire settings vars into sync panel so Start Sync reads them live
         self._sync_panel.set_settings_vars(
@@ -45,14 +66,30 @@ class MainWindow(ttk.Frame):
         self._notebook = notebook
 
     def _on_tab_changed(self, _event):
-        tab = self._notebook.select()
-        name = self._notebook.tab(tab, "text").strip()
-        if name == "History":
-            self._history_panel.refresh()
+        tab_id = self._notebook.select()
+        callback = self._tab_callbacks.get(tab_id)
+        if callback:
+            callback()
+        self._organize_panel.set_visible(tab_id == self._organize_tab_id)
 
     def _on_drives_changed(self, drives):
         self._sync_panel.refresh_drives()
 
+    def _on_device_event(self):
+        # Fired on the listener thread — hop to the Tk main thread.
+        self.after(0, self._drive_monitor.on_device_event)
+
+    def _on_unmap(self, event):
+        if event.widget is self._toplevel:
+            self._polling_paused = True
+
+    def _on_map(self, event):
+        if event.widget is self._toplevel:
+            self._polling_paused = False
+
     def _schedule_drive_poll(self):
-        self._drive_monitor.check()
+        # Keep the timer alive while paused so polling resumes on <Map>,
+        # but skip the actual enumeration.
+        if not self._polling_paused:
+            self._drive_monitor.check()
         self.after(DRIVE_POLL_INTERVAL_MS, self._schedule_drive_poll)
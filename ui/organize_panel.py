@@ -1,13 +1,12 @@
 """Organize tab: segregates images/videos into year/month folders by EXIF date."""
 import os
-import queue
 import threading
 import tkinter as tk
+from collections import deque
 from tkinter import ttk, filedialog, messagebox
 from typing import Optional
 
-from core.image_organizer import FileEvent, OrganizeResult, organize_folder
-from ui.widgets import SectionLabel
+from ui.widgets import SectionLabel, hr
 from utils.logger import get_logger
 
 log = get_logger("synctool.organize")
@@ -15,15 +14,56 @@ log = get_logger("synctool.organize")
 _FEED_MAX_ROWS = 2000
 
 
+def _norm_path(raw: str) -> str:
+    """Normalized path for a (possibly empty) entry value."""
+    raw = raw.strip()
+    return os.path.normpath(raw) if raw else ""
+
+
+# Static UI text at module level — built and interned once, not per panel.
+_MODE_OPTIONS = (
+    ("Copy  (keep originals in source)", "copy"),
+    ("Move  (remove originals from source)", "move"),
+)
+
+_OUTPUT_STRUCTURE_TEXT = (
+    "dest/\n"
+    "  2024/\n"
+    "    2024-01/   \u2190 EXIF date Jan 2024\n"
+    "    2024-12/   \u2190 EXIF date Dec 2024\n"
+    "  2025/\n"
+    "    2025-06/   \u2190 EXIF date Jun 2025\n"
+    "  misc/        \u2190 no EXIF metadata found"
+)
+
+_SUPPORTED_FORMATS_TEXT = (
+    "Supported: JPEG, PNG, TIFF, HEIC, RAW (CR2/NEF/ARW/DNG…),\n"
+    "WebP, BMP, GIF, MP4, MOV, AVI, MKV, WMV and more.\n"
+    "Videos always go to misc/ (no EXIF)."
+)
+
+
 class OrganizePanel(ttk.Frame):
     """Tab for segregating images/videos into year/month folders by EXIF date."""
 
+    # Feed column labels, precomputed per status instead of .upper() per row.
+    _STATUS_LABELS = {"organized": "ORGANIZED", "misc": "MISC", "error": "ERROR"}
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self._cancel_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
-        self._event_queue: queue.Queue = queue.Queue()
-        self._feed_count = 0
+        # Plain deque, same as utils.events: append/popleft are atomic under
+        # the GIL, so worker and mainloop need no lock or condition variable.
+        self._event_queue: deque = deque()
+        # Item ids of the rows currently in the feed, oldest first — lets
+        # the cap trim delete the oldest rows without a get_children() call.
+        self._feed_ids: deque = deque()
+        # Feed rows buffered while the tab is hidden; maxlen matches the
+        # feed cap so a long background run can't grow the buffer unbounded.
+        self._visible = True
+        self._pending_evts: deque = deque(maxlen=_FEED_MAX_ROWS)
+        self._last_pct = -1  # last percentage written to the progress bar
         self._build_ui()
         self._poll_queue()
 
@@ -49,6 +89,12 @@ class OrganizePanel(ttk.Frame):
         src_row = ttk.Frame(parent)
         src_row.pack(fill="x", padx=8, pady=(0, 6))
         self._src_var = tk.StringVar()
+        # Normalize once per edit instead of re-normalizing both paths on
+        # every Start click.
+        self._src_norm = ""
+        self._src_var.trace_add(
+            "write", lambda *_: setattr(self, "_src_norm",
+                                        _norm_path(self._src_var.get())))
         ttk.Entry(src_row, textvariable=self._src_var).pack(
             side="left", fill="x", expand=True, padx=(0, 4)
         )
@@ -59,26 +105,26 @@ class OrganizePanel(ttk.Frame):
         dst_row = ttk.Frame(parent)
         dst_row.pack(fill="x", padx=8, pady=(0, 6))
         self._dst_var = tk.StringVar()
+        self._dst_norm = ""
+        self._dst_var.trace_add(
+            "write", lambda *_: setattr(self, "_dst_norm",
+                                        _norm_path(self._dst_var.get())))
         ttk.Entry(dst_row, textvariable=self._dst_var).pack(
             side="left", fill="x", expand=True, padx=(0, 4)
         )
         ttk.Button(dst_row, text="...", width=3, command=self._browse_dst).pack(side="left")
 
-        ttk.Separator(parent, orient="horizontal").pack(fill="x", padx=8, pady=8)
+        hr(parent)
 
         # Mode
         SectionLabel(parent, text="MODE").pack(anchor="w", padx=8, pady=(2, 4))
         self._mode_var = tk.StringVar(value="copy")
-        ttk.Radiobutton(
-            parent, text="Copy  (keep originals in source)",
-            value="copy", variable=self._mode_var,
-        ).pack(anchor="w", padx=20, pady=2)
-        ttk.Radiobutton(
-            parent, text="Move  (remove originals from source)",
-            value="move", variable=self._mode_var,
-        ).pack(anchor="w", padx=20, pady=2)
+        for label, value in _MODE_OPTIONS:
+            ttk.Radiobutton(
+                parent, text=label, value=value, variable=self._mode_var,
+            ).pack(anchor="w", padx=20, pady=2)
 
-        ttk.Separator(parent, orient="horizontal").pack(fill="x", padx=8, pady=8)
+        hr(parent)
 
         # Buttons
         btn_row = ttk.Frame(parent)
@@ -94,7 +140,7 @@ class OrganizePanel(ttk.Frame):
         )
         self._cancel_btn.pack(side="left")
 
-        ttk.Separator(parent, orient="horizontal").pack(fill="x", padx=8, pady=8)
+        hr(parent)
 
         # Progress
         SectionLabel(parent, text="PROGRESS").pack(anchor="w", padx=8, pady=(2, 4))
@@ -106,7 +152,7 @@ class OrganizePanel(ttk.Frame):
             foreground="#666666", font=("", 8),
         ).pack(anchor="w", padx=8)
 
-        ttk.Separator(parent, orient="horizontal").pack(fill="x", padx=8, pady=8)
+        hr(parent)
 
         # Summary
         SectionLabel(parent, text="SUMMARY").pack(anchor="w", padx=8, pady=(2, 2))
@@ -116,32 +162,18 @@ class OrganizePanel(ttk.Frame):
             wraplength=300, foreground="#555555",
         ).pack(anchor="w", padx=8, pady=(2, 8))
 
-        ttk.Separator(parent, orient="horizontal").pack(fill="x", padx=8, pady=4)
+        hr(parent, pady=4)
 
         # Output structure diagram
         SectionLabel(parent, text="OUTPUT STRUCTURE").pack(anchor="w", padx=8, pady=(6, 2))
         ttk.Label(
-            parent,
-            text=(
-                "dest/\n"
-                "  2024/\n"
-                "    2024-01/   \u2190 EXIF date Jan 2024\n"
-                "    2024-12/   \u2190 EXIF date Dec 2024\n"
-                "  2025/\n"
-                "    2025-06/   \u2190 EXIF date Jun 2025\n"
-                "  misc/        \u2190 no EXIF metadata found"
-            ),
+            parent, text=_OUTPUT_STRUCTURE_TEXT,
             font=("Consolas", 8), foreground="#888888", justify="left",
         ).pack(anchor="w", padx=16, pady=(0, 8))
 
         # Supported formats note
         ttk.Label(
-            parent,
-            text=(
-                "Supported: JPEG, PNG, TIFF, HEIC, RAW (CR2/NEF/ARW/DNG…),\n"
-                "WebP, BMP, GIF, MP4, MOV, AVI, MKV, WMV and more.\n"
-                "Videos always go to misc/ (no EXIF)."
-            ),
+            parent, text=_SUPPORTED_FORMATS_TEXT,
             font=("", 8), foreground="#888888", justify="left", wraplength=300,
         ).pack(anchor="w", padx=8, pady=(0, 8))
 
@@ -208,8 +240,9 @@ class OrganizePanel(ttk.Frame):
             )
             return
 
-        source = self._src_var.get().strip()
-        dest   = self._dst_var.get().strip()
+        # Already normalized by the StringVar write traces.
+        source = self._src_norm
+        dest   = self._dst_norm
 
         if not source or not os.path.isdir(source):
             messagebox.showerror(
@@ -221,7 +254,7 @@ class OrganizePanel(ttk.Frame):
                 "No Destination", "Please select a destination folder.", parent=self
             )
             return
-        if os.path.normpath(source) == os.path.normpath(dest):
+        if source == dest:
             messagebox.showerror(
                 "Same Folder",
                 "Source and destination must be different folders.", parent=self
@@ -241,6 +274,7 @@ class OrganizePanel(ttk.Frame):
         self._feed_clear()
         self._summary_var.set("Running\u2026")
         self._prog_bar["value"] = 0
+        self._last_pct = 0
         self._prog_label_var.set("")
         self._start_btn.config(state="disabled")
         self._cancel_btn.config(state="normal")
@@ -258,6 +292,9 @@ class OrganizePanel(ttk.Frame):
         self._cancel_btn.config(state="disabled")
 
     def _worker(self, source: str, dest: str, move: bool):
+        # First import here, off the Tk thread: the Organise machinery is
+        # one tab out of four, so cold window start shouldn't pay for it.
+        from core.image_organizer import OrganizeResult, organize_folder
         try:
             result = organize_folder(
                 source=source,
@@ -266,57 +303,95 @@ class OrganizePanel(ttk.Frame):
                 cancel_event=self._cancel_event,
                 event_queue=self._event_queue,
             )
-            self._event_queue.put(("done", result))
+            self._event_queue.append(("done", result))
         except Exception as exc:
             log.exception("Organizer error: %s", exc)
             r = OrganizeResult(cancelled=False)
             r.errors = 1
-            self._event_queue.put(("done", r))
+            self._event_queue.append(("done", r))
 
     # ------------------------------------------------------------------
     # Queue polling (main thread)
     # ------------------------------------------------------------------
 
     def _poll_queue(self):
+        # Everything available is drained in one tick and applied as a
+        # batch: one overflow trim, one insert loop, one scroll, and only
+        # the final progress tuple — instead of a Tk round trip per event.
+        file_evts: list = []
+        progress = None
+        popleft = self._event_queue.popleft
         try:
             while True:
-                item = self._event_queue.get_nowait()
-                if isinstance(item, FileEvent):
-                    self._on_file_event(item)
-                elif isinstance(item, tuple):
+                item = popleft()
+                # Control messages are tuples; anything else is a FileEvent
+                # (checked by shape so core.image_organizer stays unimported
+                # until a job actually starts).
+                if isinstance(item, tuple):
                     kind = item[0]
                     if kind == "progress":
-                        self._on_progress(item[1], item[2])
+                        progress = item
                     elif kind == "done":
                         self._on_done(item[1])
                     elif kind == "fatal":
                         self._on_fatal(item[1])
-        except queue.Empty:
-            pass
+                else:
+                    file_evts.append(item)
+        except IndexError:
+            pass  # queue drained
         finally:
-            self.after(200, self._poll_queue)
-
-    def _on_file_event(self, evt: FileEvent):
-        tag = evt.status  # "organized" | "misc" | "error"
-        label = evt.status.upper()
-        if evt.status == "error":
-            label = f"ERROR"
-
-        if self._feed_count >= _FEED_MAX_ROWS:
-            self._feed.delete(self._feed.get_children()[0])
-            self._feed_count -= 1
-
-        self._feed.insert(
-            "", "end",
-            values=(label, evt.dest_folder, evt.rel_src),
-            tags=(tag,),
-        )
-        self._feed_count += 1
+            drained = bool(file_evts) or progress is not None
+            if file_evts:
+                if self._visible:
+                    self._apply_file_events(file_evts)
+                else:
+                    # No Treeview work while hidden; rows land on flush.
+                    self._pending_evts.extend(file_evts)
+            if progress is not None:
+                self._on_progress(progress[1], progress[2])
+            # Adaptive cadence: poll fast while a run is producing events,
+            # back off to idle speed once the queue comes up empty.
+            self.after(30 if drained else 200, self._poll_queue)
+
+    def set_visible(self, visible: bool):
+        """Called by the main window on tab switches.
+
+        While hidden the feed buffers events instead of updating the
+        Treeview; switching back flushes the backlog in one batch.
+        """
+        self._visible = visible
+        if visible and self._pending_evts:
+            evts = list(self._pending_evts)
+            self._pending_evts.clear()
+            self._apply_file_events(evts)
+
+    def _apply_file_events(self, evts: list):
+        if len(evts) > _FEED_MAX_ROWS:
+            evts = evts[-_FEED_MAX_ROWS:]  # only the tail would survive anyway
+        feed_ids = self._feed_ids
+        overflow = len(feed_ids) + len(evts) - _FEED_MAX_ROWS
+        if overflow > 0:
+            popleft = feed_ids.popleft
+            self._feed.delete(*[popleft() for _ in range(overflow)])
+        insert = self._feed.insert
+        append_id = feed_ids.append
+        labels = self._STATUS_LABELS
+        for evt in evts:
+            status = evt.status  # "organized" | "misc" | "error"
+            append_id(insert(
+                "", "end",
+                values=(labels[status], evt.dest_folder, evt.rel_src),
+                tags=(status,),
+            ))
         self._feed.yview_moveto(1.0)
 
     def _on_progress(self, done: int, total: int):
         pct = int(done / total * 100) if total > 0 else 0
-        self._prog_bar["value"] = pct
+        # Setting a Progressbar value is a Tcl round trip plus a redraw;
+        # skip it while the integer percentage hasn't moved.
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self._prog_bar["value"] = pct
         self._prog_label_var.set(f"{done} / {total} files")
 
     def _on_fatal(self, msg: str):
@@ -326,7 +401,7 @@ class OrganizePanel(ttk.Frame):
         self._summary_var.set("Failed — see error dialog.")
         messagebox.showerror("Organise Error", msg, parent=self)
 
-    def _on_done(self, result: OrganizeResult):
+    def _on_done(self, result: "OrganizeResult"):  # noqa: F821 — deferred import
         self._start_btn.config(state="normal")
         self._cancel_btn.config(state="disabled")
         if not result.cancelled:
@@ -342,4 +417,4 @@ class OrganizePanel(ttk.Frame):
 
     def _feed_clear(self):
         self._feed.delete(*self._feed.get_children())
-        self._feed_count = 0
+        self._feed_ids.clear()
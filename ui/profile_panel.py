@@ -1,5 +1,6 @@
 """Left panel: profile management, source path, and destination drive selection."""
 import os
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from typing import Callable, Optional
@@ -21,6 +22,12 @@ class ProfilePanel(ttk.Frame):
         self._profiles: list[SyncProfile] = []
         self._current_profile: Optional[SyncProfile] = None
         self._available_drives: list[DriveInfo] = []
+        self._drives_by_serial: dict[str, DriveInfo] = {}
+        self._drives_by_name: dict[str, DriveInfo] = {}
+        self._drive_options: list[str] = ["-- None --"]
+        # Drive enumeration (WMI / volume queries) is slow; cache the result
+        # and only re-scan after the DriveMonitor reports a hardware change.
+        self._drive_cache_dirty = True
         self._on_profile_changed = on_profile_changed
 
         # Drive destination slot variables
@@ -71,7 +78,7 @@ class ProfilePanel(ttk.Frame):
             combo.bind("<<ComboboxSelected>>", lambda e, idx=i: self._on_dest_select(idx))
             self._dest_combos.append(combo)
 
-        ttk.Button(self, text="Refresh Drives", command=self.refresh_drives).pack(
+        ttk.Button(self, text="Refresh Drives", command=self._force_refresh_drives).pack(
             padx=8, pady=8, anchor="w"
         )
 
@@ -85,15 +92,49 @@ class ProfilePanel(ttk.Frame):
     # Drive management
     # ------------------------------------------------------------------
 
-    def refresh_drives(self):
-        self._available_drives = get_all_non_cdrom_drives()
-        drive_options = ["-- None --"] + [d.display_name for d in self._available_drives]
+    def mark_drives_dirty(self):
+        """Invalidate the drive cache; called when the DriveMonitor reports
+        a hardware change. The next refresh_drives_async() re-enumerates."""
+        self._drive_cache_dirty = True
+
+    def refresh_drives_async(self):
+        """Re-enumerate drives on a worker thread if the cache is stale.
+
+        get_all_non_cdrom_drives() can block for hundreds of ms on offline
+        USB volumes, and Tk widgets may only be touched from the main
+        thread — so the scan runs in a daemon thread and the result is
+        marshalled back through after().
+        """
+        if not self._drive_cache_dirty and self._available_drives:
+            return  # cached enumeration is still current
+        threading.Thread(target=self._scan_drives, daemon=True,
+                         name="drive-scan").start()
+
+    def _scan_drives(self):
+        drives = get_all_non_cdrom_drives()
+        self.after(0, self._apply_drives, drives)
+
+    def _apply_drives(self, drives: list[DriveInfo]):
+        """Main thread: install a fresh enumeration and update the combos."""
+        self._available_drives = drives
+        # Lookup dicts built once per enumeration: profile load/save resolve
+        # drives per slot, and a linear scan per slot adds up.
+        self._drives_by_serial = {d.serial: d for d in drives}
+        self._drives_by_name = {d.display_name: d for d in drives}
+        self._drive_cache_dirty = False
+        drive_options = ["-- None --"] + [d.display_name for d in drives]
+        self._drive_options = drive_options
         for combo in self._dest_combos:
             current = combo.get()
             combo["values"] = drive_options
             if current not in drive_options:
                 combo.set("-- None --")
 
+    def _force_refresh_drives(self):
+        """Explicit user request always re-enumerates."""
+        self.mark_drives_dirty()
+        self.refresh_drives_async()
+
     def _on_dest_select(self, idx: int):
         self._mark_dirty()
 
@@ -108,7 +149,7 @@ class ProfilePanel(ttk.Frame):
         if self._profiles:
             self._profile_combo.current(0)
             self._load_profile(self._profiles[0])
-        self.refresh_drives()
+        self.refresh_drives_async()
 
     def _on_profile_select(self, _event=None):
         idx = self._profile_combo.current()
@@ -118,7 +159,7 @@ class ProfilePanel(ttk.Frame):
     def _load_profile(self, profile: SyncProfile):
         self._current_profile = profile
         self._source_picker.path = profile.source_path
-        self.refresh_drives()
+        self.refresh_drives_async()
 
         # Reset destination combos
         for combo, var in zip(self._dest_combos, self._dest_vars):
@@ -129,10 +170,7 @@ class ProfilePanel(ttk.Frame):
             slot_idx = dest.slot - 1  # slot is 1-based
             if 0 <= slot_idx < MAX_DRIVES:
                 # Find matching drive by serial
-                matched = next(
-                    (d for d in self._available_drives if d.serial == dest.drive_serial),
-                    None,
-                )
+                matched = self._drives_by_serial.get(dest.drive_serial)
                 if matched:
                     self._dest_vars[slot_idx].set(matched.display_name)
                 else:
@@ -199,26 +237,7 @@ class ProfilePanel(ttk.Frame):
         self._current_profile.source_path = src
         self._repo.save(self._current_profile)
 
-        # Save destinations
-        dests: list[ProfileDestination] = []
-        for i, (var, combo) in enumerate(zip(self._dest_vars, self._dest_combos)):
-            selected = var.get()
-            if selected and selected != "-- None --" and not selected.startswith("[offline]"):
-                drive = next(
-                    (d for d in self._available_drives if d.display_name == selected),
-                    None,
-                )
-                if drive:
-                    dest_path = os.path.join(drive.letter, "SyncTool_Backup")
-                    dests.append(ProfileDestination(
-                        id=None,
-                        profile_id=self._current_profile.id,
-                        drive_serial=drive.serial,
-                        drive_label=drive.label,
-                        dest_path=dest_path,
-                        slot=i + 1,
-                    ))
-
+        dests = self._collect_selected_destinations(self._current_profile.id)
         self._repo.save_destinations(self._current_profile.id, dests)
         # Reload to get IDs
         self._current_profile = self._repo.get_by_id(self._current_profile.id)
@@ -239,22 +258,26 @@ class ProfilePanel(ttk.Frame):
         """Return the destinations currently selected in the UI (unsaved state too)."""
         if not self._current_profile:
             return []
+        return self._collect_selected_destinations(self._current_profile.id)
+
+    def _collect_selected_destinations(self, profile_id) -> list[ProfileDestination]:
+        """Build ProfileDestination rows from the current combo selections.
+
+        Shared by _save_profile and get_active_destinations; offline and
+        empty slots are skipped.
+        """
         dests: list[ProfileDestination] = []
-        for i, (var, combo) in enumerate(zip(self._dest_vars, self._dest_combos)):
+        for i, var in enumerate(self._dest_vars):
             selected = var.get()
             if selected and selected != "-- None --" and not selected.startswith("[offline]"):
-                drive = next(
-                    (d for d in self._available_drives if d.display_name == selected),
-                    None,
-                )
+                drive = self._drives_by_name.get(selected)
                 if drive:
-                    dest_path = os.path.join(drive.letter, "SyncTool_Backup")
                     dests.append(ProfileDestination(
                         id=None,
-                        profile_id=self._current_profile.id,
+                        profile_id=profile_id,
                         drive_serial=drive.serial,
                         drive_label=drive.label,
-                        dest_path=dest_path,
+                        dest_path=os.path.join(drive.letter, "SyncTool_Backup"),
                         slot=i + 1,
                     ))
         return dests
@@ -1,9 +1,19 @@
 """Settings panel — hash mode, mirror mode, conflict resolution."""
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from ui.widgets import hr
 from utils.config import DB_PATH
 
+# Static option strings live at module level so they are built and interned
+# once, not per panel construction.
+_CONFLICT_OPTIONS = (
+    ("Keep both — rename the conflicting file with a timestamp  (safe default)", "keep_both"),
+    ("Prefer source — overwrite destination",                                    "prefer_source"),
+    ("Prefer destination — overwrite source",                                   "prefer_dest"),
+)
+
 
 class SettingsPanel(ttk.Frame):
     """Embedded settings panel (Settings notebook tab)."""
@@ -24,7 +34,7 @@ class SettingsPanel(ttk.Frame):
             wraplength=460, foreground="#555555",
         ).pack(fill="x", **pad)
 
-        ttk.Separator(self, orient="horizontal").pack(fill="x", padx=8, pady=4)
+        hr(self, pady=4)
 
         ttk.Checkbutton(
             self,
@@ -33,7 +43,7 @@ class SettingsPanel(ttk.Frame):
             variable=self.use_hash_var,
         ).pack(anchor="w", **pad)
 
-        ttk.Separator(self, orient="horizontal").pack(fill="x", padx=8, pady=4)
+        hr(self, pady=4)
 
         ttk.Checkbutton(
             self,
@@ -42,31 +52,44 @@ class SettingsPanel(ttk.Frame):
             variable=self.delete_var,
         ).pack(anchor="w", **pad)
 
-        ttk.Separator(self, orient="horizontal").pack(fill="x", padx=8, pady=4)
+        hr(self, pady=4)
 
         ttk.Label(self, text="Conflict resolution (bidirectional sync):",
                   font=("", 9, "bold")).pack(anchor="w", padx=12)
         self._conflict_var = tk.StringVar(value="keep_both")
-        for label, value in [
-            ("Keep both — rename the conflicting file with a timestamp  (safe default)", "keep_both"),
-            ("Prefer source — overwrite destination",                                    "prefer_source"),
-            ("Prefer destination — overwrite source",                                   "prefer_dest"),
-        ]:
+        for label, value in _CONFLICT_OPTIONS:
             ttk.Radiobutton(
                 self, text=label, value=value, variable=self._conflict_var
             ).pack(anchor="w", padx=24, pady=1)
 
-        ttk.Separator(self, orient="horizontal").pack(fill="x", padx=8, pady=12)
+        hr(self, pady=12)
 
         ttk.Label(self, text="Database", font=("", 9, "bold")).pack(anchor="w", padx=12)
         ttk.Label(self, text=f"Location: {DB_PATH}",
                   wraplength=460, foreground="#555555").pack(anchor="w", padx=12)
-        ttk.Button(self, text="Vacuum DB  (shrink file size)",
-                   command=self._vacuum).pack(anchor="w", padx=12, pady=6)
+        self._vacuum_btn = ttk.Button(self, text="Vacuum DB  (shrink file size)",
+                                      command=self._vacuum)
+        self._vacuum_btn.pack(anchor="w", padx=12, pady=6)
 
     def _vacuum(self):
+        # VACUUM rewrites the whole database file; run it on a worker thread
+        # so the mainloop keeps repainting, and report back via after().
+        self._vacuum_btn.config(state="disabled", text="Vacuuming…")
+        threading.Thread(target=self._do_vacuum, daemon=True,
+                         name="vacuum").start()
+
+    def _do_vacuum(self):
         from db.database import get_conn
-        conn, lock = get_conn()
-        with lock:
-            conn.execute("VACUUM")
-        messagebox.showinfo("Done", "Database vacuumed successfully.", parent=self)
+        try:
+            get_conn().execute("VACUUM")
+            error = ""
+        except Exception as exc:
+            error = str(exc)
+        self.after(0, self._vacuum_done, error)
+
+    def _vacuum_done(self, error: str):
+        self._vacuum_btn.config(state="normal", text="Vacuum DB  (shrink file size)")
+        if error:
+            messagebox.showerror("Vacuum Failed", error, parent=self)
+        else:
+            messagebox.showinfo("Done", "Database vacuumed successfully.", parent=self)
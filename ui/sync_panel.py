@@ -1,7 +1,10 @@
 """Main sync panel: source list, destination drives, direction, controls, progress, log."""
 import os
+import threading
 import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from tkinter import ttk, filedialog, messagebox
 from typing import Optional
 
@@ -11,13 +14,15 @@ from db.models import DriveJob, SyncDrive
 from db.repository import SettingsRepository
 from ui.widgets import SectionLabel, ProgressRow
 from utils import events
-from utils.config import MAX_DRIVES, UI_QUEUE_POLL_MS
+from utils.config import MAX_DRIVES
 from utils.logger import get_logger
 
 log = get_logger("synctool.ui")
 
 _FEED_MAX_ROWS = 2000
 
+_IS_WINDOWS = os.name == "nt"
+
 _ACTION_COLORS = {
     "copy":     "#44cc44",
     "conflict": "#ffaa00",
@@ -27,6 +32,43 @@ _ACTION_COLORS = {
 }
 
 
+def _paths_exist(paths) -> dict:
+    """Return {path: exists} with stats batched per parent directory.
+
+    Sources often share a parent; one scandir replaces a stat per path,
+    which matters on network mounts where each stat is a round trip.
+    Small groups keep the plain os.path.exists call.
+    """
+    by_parent: dict = {}
+    result: dict = {}
+    for p in paths:
+        name = os.path.basename(p)
+        if not name:
+            # Drive roots ("C:\\", "/") are their own dirname and have no
+            # basename to find in a scandir listing — stat them directly.
+            result[p] = os.path.exists(p)
+            continue
+        by_parent.setdefault(os.path.dirname(p), []).append((p, name))
+    for parent, group in by_parent.items():
+        if len(group) >= 3:
+            try:
+                with os.scandir(parent) as it:
+                    names = {e.name for e in it}
+            except OSError:
+                names = None
+            if names is not None:
+                if _IS_WINDOWS:
+                    # Filesystem lookups there are case-insensitive;
+                    # the membership test has to match.
+                    names = {n.lower() for n in names}
+                for p, name in group:
+                    result[p] = (name.lower() if _IS_WINDOWS else name) in names
+                continue
+        for p, _name in group:
+            result[p] = os.path.exists(p)
+    return result
+
+
 class SyncPanel(ttk.Frame):
     """Single panel containing all sync controls."""
 
@@ -34,13 +76,33 @@ class SyncPanel(ttk.Frame):
         super().__init__(parent, **kwargs)
         self._manager: Optional[ParallelSyncManager] = None
         self._available_drives = []
+        self._drives_by_display: dict = {}
+        self._drives_by_serial: dict = {}
+        self._letters_by_serial: dict = {}
+        # Mirrors the source listbox contents for O(1) duplicate checks —
+        # Listbox.get(0, "end") is a Tcl round trip per call.
+        self._source_set: set = set()
+        # Drive enumeration runs off the Tk thread (WMI / volume queries can
+        # block for hundreds of ms); one worker serializes scans and the
+        # timestamp coalesces rapid refresh requests.
+        self._drive_executor = ThreadPoolExecutor(max_workers=1,
+                                                  thread_name_prefix="drive-scan")
+        self._last_drive_scan = 0.0
+        self._refresh_pending = False
+        self._pending_session_drives: Optional[list] = None
         self._settings_repo = SettingsRepository()
         self._start_time: Optional[float] = None
         self._timer_id: Optional[str] = None
+        self._last_elapsed_str = ""
         self._progress_rows = []
         self._serial_to_row: dict = {}
         self._serial_to_label: dict = {}
 
+        # Deferred auto-scroll state (see _schedule_scroll)
+        self._log_dirty = False
+        self._feed_dirty = False
+        self._scroll_scheduled = False
+
         self._dest_drive_vars = [tk.StringVar(value="") for _ in range(MAX_DRIVES)]
         self._dest_path_vars = [tk.StringVar(value="") for _ in range(MAX_DRIVES)]
         self._direction_var = tk.StringVar(value="source_to_dest")
@@ -50,7 +112,11 @@ class SyncPanel(ttk.Frame):
         self._delete_var = tk.BooleanVar(value=False)
 
         self._build_ui()
-        self._schedule_queue_drain()
+        # Event pump: a daemon thread sleeps on the bus instead of the UI
+        # waking every poll interval; it posts a drain to the main thread
+        # only when events actually arrive.
+        threading.Thread(target=self._pump_events, daemon=True,
+                         name="ui-events").start()
         self._load_last_session()
 
     # ------------------------------------------------------------------
@@ -186,10 +252,13 @@ class SyncPanel(ttk.Frame):
         SectionLabel(parent, text="LOG").pack(anchor="w", padx=8, pady=(6, 2))
         log_frame = ttk.Frame(parent)
         log_frame.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        # Kept writable — read-only is enforced by swallowing key presses —
+        # so appends skip the two config(state=...) Tcl calls per line.
         self._log_text = tk.Text(
-            log_frame, height=5, state="disabled", wrap="none",
+            log_frame, height=5, wrap="none",
             font=("Consolas", 8), bg="#1e1e1e", fg="#d4d4d4",
         )
+        self._log_text.bind("<Key>", lambda e: "break")
         vsb = ttk.Scrollbar(log_frame, orient="vertical",   command=self._log_text.yview)
         hsb = ttk.Scrollbar(log_frame, orient="horizontal", command=self._log_text.xview)
         self._log_text.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
@@ -206,31 +275,31 @@ class SyncPanel(ttk.Frame):
         feed_frame = ttk.Frame(parent)
         feed_frame.pack(fill="both", expand=True, padx=8, pady=(0, 8))
 
-        cols = ("Action", "Drive", "File", "Size")
-        self._feed_tree = ttk.Treeview(
-            feed_frame, columns=cols, show="headings",
-            selectmode="none", height=30,
+        # A Text widget instead of a Treeview: the feed is append-then-trim
+        # only, and Treeview keeps a full item model in Tcl memory with O(N)
+        # deletes when trimming the head. Text trims with one delete("1.0",
+        # "N.0") call and takes a whole batch in a single insert.
+        header = ttk.Label(
+            feed_frame, font=("Consolas", 9, "bold"),
+            text=f"{'ACTION':<10}{'DRIVE':<8}{'FILE':<50}{'SIZE':>10}",
+        )
+        header.pack(anchor="w")
+        self._feed_text = tk.Text(
+            feed_frame, wrap="none", height=30,
+            font=("Consolas", 9), bg="#1e1e1e", fg="#d4d4d4",
         )
-        self._feed_tree.heading("Action", text="Action")
-        self._feed_tree.heading("Drive",  text="Drive")
-        self._feed_tree.heading("File",   text="File")
-        self._feed_tree.heading("Size",   text="Size")
-        self._feed_tree.column("Action", width=72,  anchor="center", stretch=False)
-        self._feed_tree.column("Drive",  width=70,  anchor="center", stretch=False)
-        self._feed_tree.column("File",   width=260, anchor="w")
-        self._feed_tree.column("Size",   width=72,  anchor="e",      stretch=False)
+        self._feed_text.bind("<Key>", lambda e: "break")
 
         # Colour tags per action type
-        self._feed_tree.tag_configure("copy",     foreground="#44cc44")
-        self._feed_tree.tag_configure("conflict", foreground="#ffaa00")
-        self._feed_tree.tag_configure("delete",   foreground="#ff5555")
-        self._feed_tree.tag_configure("error",    foreground="#ff5555")
-        self._feed_tree.tag_configure("skip",     foreground="#888888")
+        for action, color in _ACTION_COLORS.items():
+            self._feed_text.tag_configure(action, foreground=color)
 
-        vsb = ttk.Scrollbar(feed_frame, orient="vertical", command=self._feed_tree.yview)
-        self._feed_tree.configure(yscrollcommand=vsb.set)
-        vsb.pack(side="right", fill="y")
-        self._feed_tree.pack(side="left", fill="both", expand=True)
+        vsb = ttk.Scrollbar(feed_frame, orient="vertical",   command=self._feed_text.yview)
+        hsb = ttk.Scrollbar(feed_frame, orient="horizontal", command=self._feed_text.xview)
+        self._feed_text.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        vsb.pack(side="right",  fill="y")
+        hsb.pack(side="bottom", fill="x")
+        self._feed_text.pack(side="left", fill="both", expand=True)
 
         self._feed_count = 0
 
@@ -242,20 +311,21 @@ class SyncPanel(ttk.Frame):
         path = filedialog.askdirectory(title="Select Source Folder", mustexist=True)
         if path:
             path = os.path.normpath(path)
-            if path not in self._source_listbox.get(0, "end"):
+            if path not in self._source_set:
                 self._source_listbox.insert("end", path)
+                self._source_set.add(path)
 
     def _add_files(self):
         paths = filedialog.askopenfilenames(title="Select Source Files")
-        existing = set(self._source_listbox.get(0, "end"))
         for p in paths:
             p = os.path.normpath(p)
-            if p not in existing:
+            if p not in self._source_set:
                 self._source_listbox.insert("end", p)
-                existing.add(p)
+                self._source_set.add(p)
 
     def _remove_selected(self):
         for idx in reversed(self._source_listbox.curselection()):
+            self._source_set.discard(self._source_listbox.get(idx))
             self._source_listbox.delete(idx)
 
     # ------------------------------------------------------------------
@@ -263,8 +333,39 @@ class SyncPanel(ttk.Frame):
     # ------------------------------------------------------------------
 
     def refresh_drives(self):
-        self._available_drives = get_all_non_cdrom_drives()
-        options = ["-- None --"] + [d.display_name for d in self._available_drives]
+        now = time.monotonic()
+        remaining = 2.0 - (now - self._last_drive_scan)
+        if remaining > 0:
+            # Coalesce rapid refreshes into one trailing scan. Dropping
+            # the request outright would lose a drive mounted within the
+            # window — the monitor only notifies once per change.
+            if not self._refresh_pending:
+                self._refresh_pending = True
+                self.after(int(remaining * 1000) + 1, self._deferred_refresh)
+            return
+        self._last_drive_scan = now
+        fut = self._drive_executor.submit(get_all_non_cdrom_drives)
+        fut.add_done_callback(self._on_drives_scanned)
+
+    def _deferred_refresh(self):
+        self._refresh_pending = False
+        self.refresh_drives()
+
+    def _on_drives_scanned(self, fut):
+        try:
+            self.after(0, self._apply_drives, fut.result())
+        except (RuntimeError, tk.TclError):
+            pass  # widget destroyed — app is shutting down
+
+    def _apply_drives(self, drives: list):
+        """Main thread: install a fresh enumeration and update the combos."""
+        self._available_drives = drives
+        # Lookup dicts built once per enumeration; combobox changes and
+        # job starts resolve drives in O(1) instead of scanning the list.
+        self._drives_by_display = {d.display_name: d for d in drives}
+        self._drives_by_serial = {d.serial: d for d in drives}
+        self._letters_by_serial = {d.serial: d.letter.rstrip("\\") for d in drives}
+        options = ["-- None --"] + [d.display_name for d in drives]
         for i, combo in enumerate(self._dest_combos):
             current = self._dest_drive_vars[i].get()
             combo["values"] = options
@@ -272,14 +373,33 @@ class SyncPanel(ttk.Frame):
                 self._dest_drive_vars[i].set("-- None --")
                 self._dest_path_vars[i].set("")
 
+        # A restored session may have been waiting for this enumeration.
+        self._apply_pending_session_drives()
+
+    def _apply_pending_session_drives(self):
+        # No-op until both the async session read and the async drive
+        # enumeration have landed; both callers run on the main thread,
+        # so whichever finishes second does the work.
+        pending = self._pending_session_drives
+        if not pending or not self._drives_by_serial:
+            return
+        self._pending_session_drives = None
+        for i, drv in enumerate(pending[:MAX_DRIVES]):
+            matched = self._drives_by_serial.get(drv.drive_serial)
+            if matched:
+                self._dest_drive_vars[i].set(matched.display_name)
+                self._dest_path_vars[i].set(drv.dest_root)
+
     def _on_drive_selected(self, idx: int):
         selected = self._dest_drive_vars[idx].get()
         if selected == "-- None --":
             self._dest_path_vars[idx].set("")
             return
-        drive = next((d for d in self._available_drives if d.display_name == selected), None)
+        drive = self._drives_by_display.get(selected)
         if drive and not self._dest_path_vars[idx].get():
-            self._dest_path_vars[idx].set(os.path.join(drive.letter, "SyncBackup"))
+            self._dest_path_vars[idx].set(
+                drive.default_dest_root or os.path.join(drive.letter, "SyncBackup")
+            )
 
     def _browse_dest(self, idx: int):
         initial = self._dest_path_vars[idx].get() or "/"
@@ -295,15 +415,15 @@ class SyncPanel(ttk.Frame):
         return list(self._source_listbox.get(0, "end"))
 
     def _get_drives(self) -> list:
+        # One pass of Tcl variable reads up front; the loop then works on
+        # plain Python strings.
+        dest_names = [v.get() for v in self._dest_drive_vars]
+        dest_paths = [v.get().strip() for v in self._dest_path_vars]
         drives = []
-        for i in range(MAX_DRIVES):
-            selected = self._dest_drive_vars[i].get()
-            dest_root = self._dest_path_vars[i].get().strip()
+        for selected, dest_root in zip(dest_names, dest_paths):
             if not selected or selected == "-- None --" or not dest_root:
                 continue
-            drive = next(
-                (d for d in self._available_drives if d.display_name == selected), None
-            )
+            drive = self._drives_by_display.get(selected)
             if drive:
                 drives.append(SyncDrive(
                     drive_serial=drive.serial,
@@ -321,8 +441,9 @@ class SyncPanel(ttk.Frame):
         if not sources:
             messagebox.showerror("No Sources", "Add at least one source folder or file.")
             return
+        exists = _paths_exist(sources)
         for s in sources:
-            if not os.path.exists(s):
+            if not exists[s]:
                 messagebox.showerror("Invalid Source", f"Path does not exist:\n{s}")
                 return
 
@@ -353,13 +474,15 @@ class SyncPanel(ttk.Frame):
         self._serial_to_row.clear()
         self._serial_to_label.clear()
         for i, (job, row) in enumerate(zip(jobs, self._progress_rows)):
-            letter = job.drive.drive_letter.rstrip("\\")
+            serial = job.drive.drive_serial
+            letter = (self._letters_by_serial.get(serial)
+                      or job.drive.drive_letter.rstrip("\\"))
             label = f"Drive {i+1}: {letter} ({job.drive.drive_label})"
             row.set_drive_label(label)
             row.reset()
             row.set_status("Waiting...", "#888888")
-            self._serial_to_row[job.drive.drive_serial] = row
-            self._serial_to_label[job.drive.drive_serial] = letter
+            self._serial_to_row[serial] = row
+            self._serial_to_label[serial] = letter
         for row in self._progress_rows[len(jobs):]:
             row.set_drive_label("---")
             row.reset()
@@ -393,110 +516,168 @@ class SyncPanel(ttk.Frame):
     # Queue drain
     # ------------------------------------------------------------------
 
-    def _schedule_queue_drain(self):
-        self.after(UI_QUEUE_POLL_MS, self._drain_queue)
+    def _pump_events(self):
+        # Worker thread: block until the bus signals, let a short window of
+        # events accumulate, then hand the drain to the Tk main thread.
+        # events put during a drain re-arm the signal, so nothing is lost.
+        while True:
+            if not events.wait(timeout=1.0):
+                continue
+            time.sleep(0.02)  # batch window
+            try:
+                self.after(0, self._drain_queue)
+            except (RuntimeError, tk.TclError):
+                return  # widget destroyed — app is shutting down
 
     def _drain_queue(self):
-        try:
-            for event in events.drain():
-                self._handle_event(event)
-        finally:
-            self._schedule_queue_drain()
-
-    def _handle_event(self, event):
-        if isinstance(event, events.ProgressEvent):
-            row = self._serial_to_row.get(event.drive_serial)
+        # Events are applied as one batch per drain: only the last progress
+        # frame per drive is rendered (intermediate frames carry no extra
+        # information), and feed rows go through a single trim/insert/scroll
+        # pass instead of a Tcl round trip per event.
+        progress_by_serial: dict = {}
+        file_actions: list = []
+        log_lines: list = []
+        for event in events.drain():
+            if isinstance(event, events.ProgressEvent):
+                progress_by_serial[event.drive_serial] = event
+            elif isinstance(event, events.FileActionEvent):
+                file_actions.append(event)
+            elif isinstance(event, events.SyncCompleteEvent):
+                self._apply_complete(event)
+            elif isinstance(event, events.LogEvent):
+                log_lines.append(event.message + "\n")
+                log_lines.append((event.level,))
+        if log_lines:
+            self._log_text.insert("end", *log_lines)
+            self._log_dirty = True
+            self._schedule_scroll()
+        for serial, event in progress_by_serial.items():
+            row = self._serial_to_row.get(serial)
             if row:
                 row.update_progress(
                     event.files_done, event.files_total,
                     event.bytes_done, event.bytes_total,
                     event.current_file,
                 )
-        elif isinstance(event, events.FileActionEvent):
-            self._feed_insert(event)
-        elif isinstance(event, events.SyncCompleteEvent):
-            row = self._serial_to_row.get(event.drive_serial)
-            if row:
-                color = {"completed": "#44cc44",
-                         "cancelled": "#ffaa00",
-                         "error":     "#ff5555"}.get(event.status, "#888888")
-                mb = event.bytes_copied / 1024 / 1024
-                row.set_status(
-                    f"{event.status.upper()}  {event.files_copied} files  {mb:.1f} MB",
-                    color,
-                )
-        elif isinstance(event, events.LogEvent):
-            self._log_append(event.message, event.level)
+        if file_actions:
+            self._feed_insert_batch(file_actions)
+
+    def _apply_complete(self, event: "events.SyncCompleteEvent"):
+        row = self._serial_to_row.get(event.drive_serial)
+        if row:
+            color = {"completed": "#44cc44",
+                     "cancelled": "#ffaa00",
+                     "error":     "#ff5555"}.get(event.status, "#888888")
+            mb = event.bytes_copied / 1024 / 1024
+            row.set_status(
+                f"{event.status.upper()}  {event.files_copied} files  {mb:.1f} MB",
+                color,
+            )
 
     # ------------------------------------------------------------------
     # File feed
     # ------------------------------------------------------------------
 
-    def _feed_insert(self, event: "events.FileActionEvent"):
-        drive_label = self._serial_to_label.get(event.drive_serial, event.drive_serial[:6])
-        action = event.action.upper()
-        size_str = _fmt_bytes(event.size_bytes) if event.size_bytes else ""
-        tag = event.action.lower()
-
-        # Trim to cap
-        if self._feed_count >= _FEED_MAX_ROWS:
-            first = self._feed_tree.get_children()[0]
-            self._feed_tree.delete(first)
-            self._feed_count -= 1
-
-        self._feed_tree.insert(
-            "", "end",
-            values=(action, drive_label, event.rel_path, size_str),
-            tags=(tag,),
-        )
-        self._feed_count += 1
-        # Auto-scroll to bottom
-        self._feed_tree.yview_moveto(1.0)
+    def _feed_insert_batch(self, batch: list):
+        if len(batch) > _FEED_MAX_ROWS:
+            batch = batch[-_FEED_MAX_ROWS:]  # only the tail would survive anyway
+        overflow = self._feed_count + len(batch) - _FEED_MAX_ROWS
+        if overflow > 0:
+            self._feed_text.delete("1.0", f"{overflow + 1}.0")
+            self._feed_count -= overflow
+
+        # Text.insert takes alternating chars/tags arguments, so the whole
+        # batch lands in one Tcl call with per-line colour tags intact.
+        serial_to_label = self._serial_to_label
+        args = []
+        append = args.append
+        for event in batch:
+            drive_label = serial_to_label.get(event.drive_serial, event.drive_serial[:6])
+            size_str = _fmt_bytes(event.size_bytes) if event.size_bytes else ""
+            action = event.action
+            append(f"{action.upper():<10}{drive_label:<8}{event.rel_path:<50}{size_str:>10}\n")
+            append((action.lower(),))
+        self._feed_text.insert("end", *args)
+        self._feed_count += len(batch)
+        self._feed_dirty = True
+        self._schedule_scroll()
+
+    def _schedule_scroll(self):
+        # Tk merges idle callbacks, so N appends inside one drain produce a
+        # single see/yview_moveto (and one redraw) instead of N.
+        if not self._scroll_scheduled:
+            self._scroll_scheduled = True
+            self.after_idle(self._flush_scroll)
+
+    def _flush_scroll(self):
+        self._scroll_scheduled = False
+        if self._log_dirty:
+            self._log_dirty = False
+            self._log_text.see("end")
+        if self._feed_dirty:
+            self._feed_dirty = False
+            self._feed_text.see("end")
 
     def _feed_clear(self):
-        self._feed_tree.delete(*self._feed_tree.get_children())
+        self._feed_text.delete("1.0", "end")
         self._feed_count = 0
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    def _log_append(self, message: str, level: str = "info"):
-        self._log_text.config(state="normal")
-        self._log_text.insert("end", message + "\n", level)
-        self._log_text.see("end")
-        self._log_text.config(state="disabled")
-
     def _log_clear(self):
-        self._log_text.config(state="normal")
         self._log_text.delete("1.0", "end")
-        self._log_text.config(state="disabled")
 
     def _tick_elapsed(self):
-        if self._start_time:
-            elapsed = int(time.time() - self._start_time)
-            h, rem = divmod(elapsed, 3600)
-            m, s = divmod(rem, 60)
-            self._elapsed_var.set(f"Elapsed: {h:02d}:{m:02d}:{s:02d}")
-            self._timer_id = self.after(1000, self._tick_elapsed)
+        if not self._start_time:
+            return
+        self._timer_id = self.after(1000, self._tick_elapsed)
+        if not self.winfo_viewable():
+            return  # keep counting, skip the redraw while hidden
+        elapsed = int(time.time() - self._start_time)
+        h, rem = divmod(elapsed, 3600)
+        m, s = divmod(rem, 60)
+        text = f"Elapsed: {h:02d}:{m:02d}:{s:02d}"
+        # Writing the StringVar fires traces and a label redraw; skip it
+        # when the displayed second hasn't changed.
+        if text != self._last_elapsed_str:
+            self._last_elapsed_str = text
+            self._elapsed_var.set(text)
 
     def _load_last_session(self):
+        # Kick the drive enumeration immediately and read the session DB
+        # (plus the exists-stat per stored source) on a worker thread, so
+        # startup never blocks the mainloop on disk. The drive slots are
+        # filled once both the session and the enumeration have landed.
+        self.refresh_drives()
+        threading.Thread(target=self._read_session, daemon=True,
+                         name="session-load").start()
+
+    def _read_session(self):
         try:
             session = self._settings_repo.load_session()
         except Exception:
             return
-        self.refresh_drives()
-        for src in session.get("sources", []):
-            if os.path.exists(src):
-                self._source_listbox.insert("end", src)
+        stored = session.get("sources", [])
+        exists = _paths_exist(stored)
+        sources = [s for s in stored if exists[s]]
+        try:
+            self.after(0, self._apply_session, session, sources)
+        except (RuntimeError, tk.TclError):
+            pass  # widget destroyed — app is shutting down
+
+    def _apply_session(self, session: dict, sources: list):
+        """Main thread: restore sources, direction and (maybe) drive slots."""
+        self._pending_session_drives = session.get("drives", [])
+        self._apply_pending_session_drives()
+        # Listbox.insert is variadic: seeding all sources in one call is a
+        # single Tcl round trip instead of one per path.
+        new = [s for s in sources if s not in self._source_set]
+        if new:
+            self._source_listbox.insert("end", *new)
+            self._source_set.update(new)
         self._direction_var.set(session.get("direction", "source_to_dest"))
-        for i, drv in enumerate(session.get("drives", [])[:MAX_DRIVES]):
-            matched = next(
-                (d for d in self._available_drives if d.serial == drv.drive_serial), None
-            )
-            if matched:
-                self._dest_drive_vars[i].set(matched.display_name)
-                self._dest_path_vars[i].set(drv.dest_root)
 
     def set_settings_vars(self, use_hash_var: tk.BooleanVar, delete_var: tk.BooleanVar):
         """Called by MainWindow to wire settings panel vars into this panel."""
@@ -504,7 +685,8 @@ class SyncPanel(ttk.Frame):
         self._delete_var = delete_var
 
 
-def _fmt_bytes(n: int) -> str:
+@lru_cache(maxsize=4096)
+def _fmt_bytes_cached(n: int) -> str:
     if n >= 1024 ** 3:
         return f"{n / 1024**3:.1f} GB"
     if n >= 1024 ** 2:
@@ -512,3 +694,13 @@ def _fmt_bytes(n: int) -> str:
     if n >= 1024:
         return f"{n / 1024:.1f} KB"
     return f"{n} B"
+
+
+def _fmt_bytes(n: int) -> str:
+    # Sizes of a megabyte and up are quantized to 64 KB before hitting the
+    # cache so large near-unique sizes stop flooding the LRU. The rendered
+    # value may understate by up to 0.1 of the displayed unit. Callers
+    # guard n == 0.
+    if n >= 1 << 20:
+        n &= ~0xFFFF
+    return _fmt_bytes_cached(n)
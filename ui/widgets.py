@@ -53,6 +53,12 @@ class ProgressRow(ttk.Frame):
         self._detail_label = ttk.Label(self, text="", font=("", 8), foreground="#666666")
         self._detail_label.pack(fill="x")
 
+        # Last rendered values — config() schedules a redraw even when the
+        # text is unchanged, so identical frames are skipped entirely.
+        self._last_pct = 0
+        self._last_status_text: Optional[str] = None
+        self._last_detail_text = ""
+
     def set_drive_label(self, text: str):
         self._drive_label.config(text=text)
 
@@ -65,24 +71,33 @@ class ProgressRow(ttk.Frame):
         current_file: str = "",
     ):
         pct = int(files_done / files_total * 100) if files_total > 0 else 0
-        self._bar["value"] = pct
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self._bar["value"] = pct
 
         mb_done = bytes_done / 1024 / 1024
         mb_total = bytes_total / 1024 / 1024
-        self._status_label.config(
-            text=f"{files_done}/{files_total} files  {mb_done:.1f}/{mb_total:.1f} MB",
-            foreground="#2266cc",
-        )
+        text = f"{files_done}/{files_total} files  {mb_done:.1f}/{mb_total:.1f} MB"
+        if text != self._last_status_text:
+            self._last_status_text = text
+            self._status_label.config(text=text, foreground="#2266cc")
         short = current_file[-60:] if len(current_file) > 60 else current_file
-        self._detail_label.config(text=short)
+        if short != self._last_detail_text:
+            self._last_detail_text = short
+            self._detail_label.config(text=short)
 
     def set_status(self, text: str, color: str = "#888888"):
+        self._last_status_text = text
         self._status_label.config(text=text, foreground=color)
+        self._last_detail_text = ""
         self._detail_label.config(text="")
 
     def reset(self):
+        self._last_pct = 0
         self._bar["value"] = 0
+        self._last_status_text = "Idle"
         self._status_label.config(text="Idle", foreground="#888888")
+        self._last_detail_text = ""
         self._detail_label.config(text="")
 
 
@@ -98,3 +113,8 @@ class Separator(ttk.Separator):
     def __init__(self, parent, **kwargs):
         kwargs.setdefault("orient", "horizontal")
         super().__init__(parent, **kwargs)
+
+
+def hr(parent, pady=8, padx=8):
+    """Create and pack a horizontal rule — one call per section divider."""
+    ttk.Separator(parent, orient="horizontal").pack(fill="x", padx=padx, pady=pady)
@@ -1,5 +1,7 @@
 """Application-wide constants and configuration."""
+import fnmatch
 import os
+import re
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -18,10 +20,27 @@ SCAN_WORKERS = 8
 # Helps most with many small files; USB bandwidth is still the ceiling for large files.
 COPY_WORKERS = 4
 
+# Files below this size are copied in per-directory batches (one read + one
+# write each, directory created once per batch) instead of the chunked
+# streaming path — amortizes per-file overhead for photo/backup workloads.
+SMALL_FILE_THRESHOLD = 1 * 1024 * 1024
+SMALL_COPY_BATCH = 32  # max files per batch task
+
+# Parallel workers for the image organizer. EXIF reads and copies are
+# I/O-bound, so several files in flight keep both drives busy.
+ORGANIZE_WORKERS = 8
+
+# Parallel workers for the hash-compare phase (use_hash mode). Each candidate
+# pair needs two full file reads; hashing several streams concurrently overlaps
+# disk latency with CPU time on the SHA core.
+HASH_WORKERS = 4
+
 # Directory names that are silently skipped during scanning.
 # These are development/VCS artifacts that are never useful to sync and can
 # contain hundreds of thousands of files (e.g. .git/objects, node_modules).
-# Add or remove entries here to customise the exclusion list.
+# Add or remove entries here to customise the exclusion list; entries may use
+# fnmatch wildcards (e.g. "site-packages*") — plain names are matched by set
+# membership, wildcard entries through one precompiled regex.
 SCAN_EXCLUDE_DIRS: frozenset = frozenset({
     # Version control internals
     ".git",
@@ -42,6 +61,33 @@ SCAN_EXCLUDE_DIRS: frozenset = frozenset({
     ".tox",
 })
 
+# Wildcard entries never match a scandir name by set membership, so the set
+# is split once at import: plain names keep the O(1) lookup, wildcards are
+# folded into a single alternation regex via fnmatch.translate.
+SCAN_EXCLUDE_PLAIN: frozenset = frozenset(
+    n for n in SCAN_EXCLUDE_DIRS if "*" not in n and "?" not in n and "/" not in n
+)
+SCAN_EXCLUDE_WILDCARDS: tuple = tuple(
+    n for n in SCAN_EXCLUDE_DIRS if "*" in n or "?" in n or "/" in n
+)
+# Scanners only ever see bare directory names, so path-qualified entries
+# like "Lib/site-packages*" are reduced to their last component.
+_EXCL_RE = (
+    re.compile(
+        "|".join(fnmatch.translate(w.rsplit("/", 1)[-1])
+                 for w in SCAN_EXCLUDE_WILDCARDS)
+    )
+    if SCAN_EXCLUDE_WILDCARDS
+    else None
+)
+
+
+def is_excluded_dir(name: str) -> bool:
+    """True when a directory name matches the scan exclusion list."""
+    if name in SCAN_EXCLUDE_PLAIN:
+        return True
+    return _EXCL_RE is not None and _EXCL_RE.match(name) is not None
+
 DRIVE_POLL_INTERVAL_MS = 2000  # how often to check for new drives
 UI_QUEUE_POLL_MS = 300          # how often the UI drains the event queue
 
@@ -1,8 +1,14 @@
-"""Thread-safe event bus using queue.Queue.
+"""Thread-safe event bus.
 
-Sync threads put events; the UI main thread drains the queue via root.after().
+Sync threads put events; the UI consumes them in batches. Backed by
+collections.deque: append/popleft are single C-level operations (no mutex
+or condvar like queue.Queue), which matters at thousands of events per
+second from the copy workers. A side-channel Event lets a consumer thread
+sleep until work arrives (see wait()) instead of polling the deque —
+producers only pay one extra flag set per put.
 """
-import queue
+import threading
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -41,18 +47,58 @@ class LogEvent:
     message: str
 
 
-# Module-level queue shared between sync threads and the UI
-_event_queue: queue.Queue = queue.Queue()
+# Module-level queues shared between sync threads and the UI. High-rate
+# per-file traffic is bounded with drop-oldest semantics so a stalled UI
+# (window drag, modal dialog) can't grow the backlog without limit; log
+# and completion events must never be lost and stay unbounded.
+_DROPPABLE_MAX = 8192
+_droppable_queue: deque = deque(maxlen=_DROPPABLE_MAX)
+_critical_queue: deque = deque()
+_dropped = 0  # approximate under concurrent producers; feeds one warning
+_event_signal = threading.Event()
+
+_signal = _event_signal.set
 
 
 def put(event) -> None:
-    _event_queue.put_nowait(event)
+    """Enqueue an event and wake any consumer blocked in wait()."""
+    global _dropped
+    if isinstance(event, (ProgressEvent, FileActionEvent)):
+        if len(_droppable_queue) >= _DROPPABLE_MAX:
+            _dropped += 1
+        _droppable_queue.append(event)
+    else:
+        _critical_queue.append(event)
+    _signal()
+
+
+def wait(timeout: Optional[float] = None) -> bool:
+    """Block until an event has been put (or *timeout* elapses).
+
+    Returns True if woken by a put. The signal is cleared on wake-up, so a
+    put that races with the subsequent drain simply re-arms it.
+    """
+    if _event_signal.wait(timeout):
+        _event_signal.clear()
+        return True
+    return False
 
 
 def drain():
-    """Yield all pending events without blocking."""
-    while True:
-        try:
-            yield _event_queue.get_nowait()
-        except queue.Empty:
-            break
+    """Yield all pending events without blocking.
+
+    Critical events (log, completion) come first, then the bounded
+    per-file/progress traffic; if the bounded queue overflowed since the
+    last drain, a single warning reports how many events were dropped.
+    """
+    global _dropped
+    for q in (_critical_queue, _droppable_queue):
+        pop = q.popleft
+        while True:
+            try:
+                yield pop()
+            except IndexError:
+                break
+    if _dropped:
+        n, _dropped = _dropped, 0
+        yield LogEvent("warning", f"UI backlog: {n} progress/file events dropped")
@@ -0,0 +1,49 @@
+"""Per-destination I/O tuning.
+
+Copy chunk size is matched to the destination's device class: fixed disks
+(likely SSD/NVMe) favor smaller chunks that fit cache and overlap nicely
+with hashing, removable USB media favor larger chunks that amortize
+per-call overhead, and network shares larger still. The probe is one
+GetDriveTypeW call per drive letter, cached for the process lifetime.
+"""
+import os
+from functools import lru_cache
+
+from utils.config import COPY_CHUNK_SIZE
+
+_IS_WINDOWS = os.name == "nt"
+
+if _IS_WINDOWS:
+    import ctypes
+
+# winbase.h drive types
+_DRIVE_REMOVABLE = 2
+_DRIVE_FIXED = 3
+_DRIVE_REMOTE = 4
+
+_CHUNK_BY_TYPE = {
+    _DRIVE_FIXED:     1 * 1024 * 1024,
+    _DRIVE_REMOVABLE: 8 * 1024 * 1024,
+    _DRIVE_REMOTE:   16 * 1024 * 1024,
+}
+
+_MIN_CHUNK = 256 * 1024
+_MAX_CHUNK = 16 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def chunk_size_for(drive_letter: str) -> int:
+    """Return the copy chunk size for a destination drive letter.
+
+    Falls back to COPY_CHUNK_SIZE when the device class can't be
+    determined (non-Windows, empty letter, UNC quirks).
+    """
+    if not _IS_WINDOWS or not drive_letter:
+        return COPY_CHUNK_SIZE
+    root = drive_letter if drive_letter.endswith("\\") else drive_letter + "\\"
+    try:
+        drive_type = ctypes.windll.kernel32.GetDriveTypeW(root)
+    except OSError:
+        return COPY_CHUNK_SIZE
+    size = _CHUNK_BY_TYPE.get(drive_type, COPY_CHUNK_SIZE)
+    return max(_MIN_CHUNK, min(size, _MAX_CHUNK))
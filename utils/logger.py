@@ -1,7 +1,9 @@
 """Logging configuration."""
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from utils.config import LOG_PATH
 
 
@@ -18,15 +20,30 @@ def setup_logging(level=logging.INFO) -> logging.Logger:
         LOG_PATH, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
     )
     fh.setFormatter(fmt)
-    logger.addHandler(fh)
 
     # Console handler
     ch = logging.StreamHandler()
     ch.setFormatter(fmt)
-    logger.addHandler(ch)
+
+    # Callers only enqueue the record; a listener thread does the actual
+    # file/console writes, so log calls on the UI or copy threads never
+    # block on disk I/O or a rotation rename.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, fh, ch, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(_stop_listener, listener)  # flush pending records on exit
+    logger._synctool_listener = listener  # keep a reference for shutdown
 
     return logger
 
 
+def _stop_listener(listener) -> None:
+    if listener._thread is not None:  # tolerate an earlier explicit stop
+        listener.stop()
+
+
 def get_logger(name: str = "synctool") -> logging.Logger:
     return logging.getLogger(name)
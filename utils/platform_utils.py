@@ -2,56 +2,309 @@
 import ctypes
 import os
 import sys
-from typing import Optional
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import NamedTuple, Optional
 
+from utils.logger import get_logger
 
-def get_volume_serial(path: str) -> Optional[str]:
-    """Return the volume serial number as a hex string for the drive containing *path*.
+log = get_logger("synctool.platform")
+
+
+# kernel32 entry points are bound once at import with explicit prototypes.
+# ctypes.windll.kernel32.Xxx resolves the attribute and infers argument
+# marshalling on every call; pre-set argtypes/restype skip both.
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _GetVolumeInformationW = _k32.GetVolumeInformationW
+    _GetVolumeInformationW.argtypes = [
+        wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD,
+        wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPDWORD,
+        wintypes.LPWSTR, wintypes.DWORD,
+    ]
+    _GetVolumeInformationW.restype = wintypes.BOOL
+
+    _GetDriveTypeW = _k32.GetDriveTypeW
+    _GetDriveTypeW.argtypes = [wintypes.LPCWSTR]
+    _GetDriveTypeW.restype = wintypes.UINT
+
+    _GetLogicalDriveStringsW = _k32.GetLogicalDriveStringsW
+    _GetLogicalDriveStringsW.argtypes = [wintypes.DWORD, wintypes.LPWSTR]
+    _GetLogicalDriveStringsW.restype = wintypes.DWORD
+
+    _GetDiskFreeSpaceExW = _k32.GetDiskFreeSpaceExW
+    _GetDiskFreeSpaceExW.argtypes = [
+        wintypes.LPCWSTR,
+        ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong),
+        ctypes.POINTER(ctypes.c_ulonglong),
+    ]
+    _GetDiskFreeSpaceExW.restype = wintypes.BOOL
+
+    _SetThreadErrorMode = _k32.SetThreadErrorMode
+    _SetThreadErrorMode.argtypes = [wintypes.DWORD, wintypes.LPDWORD]
+    _SetThreadErrorMode.restype = wintypes.BOOL
+
+    _GetVolumeInformationByHandleW = _k32.GetVolumeInformationByHandleW
+    _GetVolumeInformationByHandleW.argtypes = [
+        wintypes.HANDLE, wintypes.LPWSTR, wintypes.DWORD,
+        wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPDWORD,
+        wintypes.LPWSTR, wintypes.DWORD,
+    ]
+    _GetVolumeInformationByHandleW.restype = wintypes.BOOL
+
+# Suppresses the "There is no disk in the drive" dialog and makes the
+# query fail immediately instead of blocking on driver timeouts.
+_SEM_FAILCRITICALERRORS = 0x0001
+_SEM_NOOPENFILEERRORBOX = 0x8000
+_SILENT_MODE = _SEM_FAILCRITICALERRORS | _SEM_NOOPENFILEERRORBOX
+
+_DRIVE_CDROM = 5
 
-    Returns None on failure (non-Windows, permission error, etc.).
+
+@contextmanager
+def _silent_errors():
+    """Run kernel32 queries fail-fast and dialog-free.
+
+    An empty reader or unreachable share otherwise blocks inside the
+    driver for up to tens of seconds and can pop a system error box;
+    under this mode the call returns ERROR_NOT_READY immediately, which
+    the negative cache then remembers. No-op off Windows.
     """
     if sys.platform != "win32":
-        return None
+        yield
+        return
+    old = ctypes.c_ulong(0)
+    _SetThreadErrorMode(_SILENT_MODE, ctypes.byref(old))
     try:
-        # GetVolumeInformation needs the root of the drive
-        root = os.path.splitdrive(path)[0] + "\\"
-        volume_name = ctypes.create_unicode_buffer(261)
-        serial = ctypes.c_ulong(0)
-        max_comp_len = ctypes.c_ulong(0)
-        fs_flags = ctypes.c_ulong(0)
-        fs_name = ctypes.create_unicode_buffer(261)
-        ok = ctypes.windll.kernel32.GetVolumeInformationW(
-            root,
-            volume_name, 261,
-            ctypes.byref(serial),
-            ctypes.byref(max_comp_len),
-            ctypes.byref(fs_flags),
-            fs_name, 261,
-        )
-        if ok:
-            return f"{serial.value:08X}"
-    except Exception:
-        pass
+        yield
+    finally:
+        _SetThreadErrorMode(old.value, None)
+
+
+# Specialized for the restricted input shape: a drive letter is one of 52
+# chars, so every canonical root is prebuilt and the hot path is a single
+# dict hit — no upper(), no concatenation, no new string per call.
+_ROOT_BY_LETTER = {c: c + ":\\" for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
+# Both cases share one canonical string, so cache keys stay identical
+# whichever case the caller used.
+_ROOT_BY_LETTER.update(
+    {c.lower(): root for c, root in list(_ROOT_BY_LETTER.items())}
+)
+
+
+def _drive_root(path: str) -> str:
+    """Normalize any path to its drive root (e.g. 'e:/x' -> 'E:\\').
+
+    Drive-letter paths are the overwhelmingly common case here;
+    os.path.splitdrive — a full scan that also understands UNC and
+    \\\\?\\ prefixes — only runs for everything else.
+    """
+    if len(path) >= 2 and path[1] == ":":
+        root = _ROOT_BY_LETTER.get(path[0])
+        if root is not None:
+            return root
+    return os.path.splitdrive(path)[0].upper() + "\\"
+
+
+# ctypes out-buffers are reused per thread instead of allocated per call —
+# create_unicode_buffer builds a fresh 522-byte array plus metadata each
+# time, pure churn for what the kernel immediately overwrites. Thread-local
+# because drive queries run from the UI, the scan executor and the monitor.
+_tls = threading.local()
+
+
+class _VolBufs:
+    """One thread's reusable out-parameters for volume queries.
+
+    The byref() wrappers are cached too: ctypes otherwise constructs a
+    fresh CArgObject per pointer argument on every call, which is most of
+    the remaining marshalling cost once argtypes are bound.
+    """
+    __slots__ = ("vol", "fs", "serial", "serial_ref", "mcl_ref", "flags_ref",
+                 "root")
+
+    def __init__(self):
+        self.vol = ctypes.create_unicode_buffer(261)     # volume name
+        self.fs = ctypes.create_unicode_buffer(261)      # filesystem name
+        self.serial = ctypes.c_ulong(0)
+        mcl = ctypes.c_ulong(0)                          # max component length
+        flags = ctypes.c_ulong(0)                        # fs flags
+        self.serial_ref = ctypes.byref(self.serial)
+        self.mcl_ref = ctypes.byref(mcl)                 # byref keeps mcl alive
+        self.flags_ref = ctypes.byref(flags)
+        # "?:\" input argument; only the letter changes between calls
+        self.root = ctypes.create_unicode_buffer(4)
+        self.root[1] = ":"
+        self.root[2] = "\\"
+
+
+def _root_arg(root: str, bufs: "_VolBufs"):
+    """LPCWSTR argument for a drive root without per-call marshalling.
+
+    Handing a str to an LPCWSTR parameter makes ctypes allocate and
+    encode a temporary wchar array every call; for the ubiquitous
+    "X:\\" roots the letter is written into a reusable 4-wchar buffer
+    instead. UNC roots fall back to normal marshalling.
+    """
+    if len(root) == 3 and root[1] == ":":
+        bufs.root[0] = root[0]
+        return bufs.root
+    return root
+
+
+def _vol_bufs() -> _VolBufs:
+    bufs = getattr(_tls, "vol_bufs", None)
+    if bufs is None:
+        bufs = _tls.vol_bufs = _VolBufs()
+    return bufs
+
+
+def get_volume_serial(path: str) -> Optional[str]:
+    """Return a stable volume identifier for the drive containing *path*.
+
+    Windows: the hex volume serial, cached per drive root — serials only
+    change when media changes, and each query is a kernel32 crossing.
+    Linux: the filesystem UUID of the mount containing *path*, resolved
+    once from /proc/mounts and /dev/disk/by-uuid. Elsewhere returns None.
+    """
+    if sys.platform == "win32":
+        return _query_volume_cached(_drive_root(path))[0]
+    apath = os.path.abspath(path)
+    for mnt, uuid in _posix_mount_serials():
+        if apath == mnt or apath.startswith(mnt.rstrip("/") + "/"):
+            return uuid
     return None
 
 
+# Linux mount table: [(mountpoint, fs-uuid)] sorted longest-mountpoint-
+# first so nested mounts win the prefix match. Built once and flushed by
+# invalidate_drive_cache, same lifecycle as the Windows caches.
+_posix_mounts: Optional[list] = None
+
+
+def _posix_mount_serials() -> list:
+    global _posix_mounts
+    if _posix_mounts is not None:
+        return _posix_mounts
+    mounts: list = []
+    try:
+        by_uuid = {}
+        base = "/dev/disk/by-uuid"
+        for uuid in os.listdir(base):
+            by_uuid[os.path.realpath(os.path.join(base, uuid))] = uuid
+        with open("/proc/mounts", encoding="utf-8") as fh:
+            for line in fh:
+                parts = line.split()
+                if len(parts) < 2 or not parts[0].startswith("/dev"):
+                    continue
+                uuid = by_uuid.get(os.path.realpath(parts[0]))
+                if uuid:
+                    # /proc/mounts octal-escapes spaces in mountpoints
+                    mounts.append((parts[1].replace("\\040", " "), uuid))
+        mounts.sort(key=lambda m: len(m[0]), reverse=True)
+    except OSError:
+        mounts = []
+    _posix_mounts = mounts
+    return mounts
+
+
 def get_volume_label(path: str) -> str:
     """Return the volume label for the drive containing *path*."""
     if sys.platform != "win32":
         return ""
+    return _query_volume_cached(_drive_root(path))[1]
+
+
+# Volume-info cache: successful answers live until invalidated, failures
+# (empty card reader, disconnected share) carry a TTL so one driver
+# timeout is never repeated per file, yet inserted media is picked up.
+_VOLUME_NEG_TTL = 30.0
+_volume_cache: dict = {}
+
+
+def _query_volume_cached(root: str) -> tuple[Optional[str], str]:
+    """One GetVolumeInformationW call yields both (serial, label).
+
+    Serial and label previously issued separate API calls even though the
+    kernel hands back everything at once; callers that want one field now
+    share a single cached crossing per root.
+    """
+    hit = _volume_cache.get(root)
+    if hit is not None:
+        result, expiry = hit
+        if expiry is None or time.monotonic() < expiry:
+            return result
+    result = _query_volume(root)
+    expiry = None if result[0] is not None else time.monotonic() + _VOLUME_NEG_TTL
+    _volume_cache[root] = (result, expiry)
+    return result
+
+
+def _query_volume(root: str) -> tuple[Optional[str], str]:
     try:
-        root = os.path.splitdrive(path)[0] + "\\"
-        volume_name = ctypes.create_unicode_buffer(261)
-        ok = ctypes.windll.kernel32.GetVolumeInformationW(
-            root,
-            volume_name, 261,
-            None, None, None, None, 0,
+        # CD-ROM drives are never sync targets and an empty tray blocks
+        # inside the driver for seconds — don't ask at all.
+        dtype = _get_type_cached(root)
+        if dtype == _DRIVE_CDROM:
+            return None, ""
+        with _silent_errors():
+            bufs = _vol_bufs()
+            bufs.vol[0] = "\x00"
+            bufs.serial.value = 0
+            ok = _GetVolumeInformationW(
+                _root_arg(root, bufs),
+                bufs.vol, 261,
+                bufs.serial_ref,
+                bufs.mcl_ref,
+                bufs.flags_ref,
+                bufs.fs, 261,
+            )
+        if ok:
+            return f"{bufs.serial.value:08X}", bufs.vol.value
+        log.debug("GetVolumeInformationW(%s) failed: error %d",
+                  root, ctypes.get_last_error())
+    except OSError:
+        pass
+    return None, ""
+
+
+def get_volume_serial_by_handle(fd: int) -> Optional[str]:
+    """Volume serial for an already-open file descriptor.
+
+    GetVolumeInformationW re-resolves the mount point on every call;
+    GetVolumeInformationByHandleW asks the volume the handle already
+    lives on, so callers holding an open file (copy and hash loops) skip
+    that lookup. *fd* is a CRT descriptor as returned by os.open / fileno().
+    Returns None on failure or off Windows.
+    """
+    if sys.platform != "win32":
+        return None
+    try:
+        import msvcrt
+        handle = msvcrt.get_osfhandle(fd)
+        bufs = _vol_bufs()
+        bufs.serial.value = 0
+        ok = _GetVolumeInformationByHandleW(
+            handle,
+            bufs.vol, 261,
+            bufs.serial_ref,
+            bufs.mcl_ref,
+            bufs.flags_ref,
+            bufs.fs, 261,
         )
         if ok:
-            return volume_name.value
-    except Exception:
+            return f"{bufs.serial.value:08X}"
+        log.debug("GetVolumeInformationByHandleW(fd=%d) failed: error %d",
+                  fd, ctypes.get_last_error())
+    except OSError:
         pass
-    return ""
+    return None
 
 
 def get_drive_type(path: str) -> int:
@@ -61,10 +314,14 @@ def get_drive_type(path: str) -> int:
     """
     if sys.platform != "win32":
         return 0
+    return _get_type_cached(_drive_root(path))
+
+
+@lru_cache(maxsize=32)
+def _get_type_cached(root: str) -> int:
     try:
-        root = os.path.splitdrive(path)[0] + "\\"
-        return ctypes.windll.kernel32.GetDriveTypeW(root)
-    except Exception:
+        return _GetDriveTypeW(_root_arg(root, _vol_bufs()))
+    except OSError:
         return 0
 
 
@@ -73,32 +330,107 @@ def list_drives() -> list[str]:
     if sys.platform != "win32":
         return []
     try:
-        buf = ctypes.create_unicode_buffer(512)
-        ctypes.windll.kernel32.GetLogicalDriveStringsW(511, buf)
-        drives = []
-        idx = 0
-        while buf[idx] != "\x00":
-            start = idx
-            while buf[idx] != "\x00":
-                idx += 1
-            drives.append(buf[start:idx])
-            idx += 1
-        return drives
-    except Exception:
+        buf = getattr(_tls, "drives_buf", None)
+        if buf is None:
+            buf = _tls.drives_buf = ctypes.create_unicode_buffer(512)
+        # Returns the number of TCHARs written (minus the final NUL), so
+        # the whole "C:\<NUL>D:\<NUL><NUL>" block converts in one slice
+        # and one split instead of a Python loop per wide char.
+        n = _GetLogicalDriveStringsW(511, buf)
+        if not n:
+            return []
+        return [p for p in ctypes.wstring_at(buf, n).split("\x00") if p]
+    except OSError:
         return []
 
 
+class DriveSpace(NamedTuple):
+    """All three figures GetDiskFreeSpaceExW returns in one call."""
+    free_avail: int   # free bytes available to the caller (quota-aware)
+    total: int        # total size of the volume
+    free_total: int   # free bytes on the volume regardless of quota
+
+
+# Free space does change during a sync, but not meaningfully per file; a
+# short TTL keeps hot call sites off the syscall without going stale.
+_FREE_TTL = 2.0
+_free_cache: dict = {}
+
+
+def drive_space(path: str) -> DriveSpace:
+    """Return (free_avail, total, free_total) for the drive containing *path*.
+
+    The kernel hands back all three figures whether one or three are
+    wanted, so callers needing free + total no longer pay two crossings.
+    All-zero on error.
+    """
+    if sys.platform != "win32":
+        try:
+            st = os.statvfs(path)
+            frsize = st.f_frsize
+            return DriveSpace(st.f_bavail * frsize, st.f_blocks * frsize,
+                              st.f_bfree * frsize)
+        except (OSError, AttributeError):
+            return DriveSpace(0, 0, 0)
+    return _space_cached(_drive_root(path))
+
+
 def drive_free_bytes(path: str) -> int:
     """Return free bytes available on the drive, 0 on error."""
+    return drive_space(path).free_avail
+
+
+def _space_cached(root: str) -> DriveSpace:
+    now = time.monotonic()
+    hit = _free_cache.get(root)
+    if hit is not None and now - hit[1] < _FREE_TTL:
+        return hit[0]
+    value = _query_space(root)
+    _free_cache[root] = (value, now)
+    return value
+
+
+def _query_space(root: str) -> DriveSpace:
     try:
-        free = ctypes.c_ulonglong(0)
+        free_avail = ctypes.c_ulonglong(0)
         total = ctypes.c_ulonglong(0)
-        ctypes.windll.kernel32.GetDiskFreeSpaceExW(
-            os.path.splitdrive(path)[0] + "\\",
-            ctypes.byref(free),
-            ctypes.byref(total),
-            None,
-        )
-        return free.value
-    except Exception:
-        return 0
+        free_total = ctypes.c_ulonglong(0)
+        with _silent_errors():
+            _GetDiskFreeSpaceExW(
+                _root_arg(root, _vol_bufs()),
+                ctypes.byref(free_avail),
+                ctypes.byref(total),
+                ctypes.byref(free_total),
+            )
+        return DriveSpace(free_avail.value, total.value, free_total.value)
+    except OSError:
+        return DriveSpace(0, 0, 0)
+
+
+def query_drive(path: str) -> tuple[Optional[str], str, int, int]:
+    """Return (serial, label, drive_type, free_bytes) for a drive in one pass.
+
+    Batches what would otherwise be four public-helper calls — each
+    re-normalizing the path to its root — into a single normalization
+    plus the minimal set of shared cached queries (the type gate inside
+    the volume query reuses the type fetched here).
+    """
+    if sys.platform != "win32":
+        return None, "", 0, 0
+    root = _drive_root(path)
+    dtype = _get_type_cached(root)
+    serial, label = _query_volume_cached(root)
+    return serial, label, dtype, _space_cached(root).free_avail
+
+
+def invalidate_drive_cache() -> None:
+    """Flush all cached volume metadata.
+
+    Call when the set of mounted drives changes — a reused drive letter
+    may now hold different media, so per-root entries can't be trusted.
+    """
+    global _posix_mounts
+    _volume_cache.clear()
+    _get_type_cached.cache_clear()
+    _free_cache.clear()
+    _posix_mounts = None
@@ -0,0 +1,136 @@
+"""Event-driven drive arrival/removal notifications via WM_DEVICECHANGE.
+
+Windows broadcasts WM_DEVICECHANGE to every top-level window when a volume
+is mounted or removed, so a hidden window with its own message pump replaces
+per-tick drive polling. Everything Win32-specific is resolved lazily inside
+start_device_listener so this module imports cleanly on any platform.
+"""
+import ctypes
+import sys
+import threading
+from typing import Callable
+
+from utils.logger import get_logger
+
+log = get_logger("synctool.devnotify")
+
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+
+_WINDOW_CLASS = "SyncToolDeviceNotify"
+
+# WNDPROC callback and window-class references must outlive this module's
+# functions or ctypes garbage-collects them under the message pump.
+_keepalive: list = []
+
+
+def start_device_listener(on_change: Callable[[], None]) -> bool:
+    """Start a hidden window that calls *on_change* on volume arrival/removal.
+
+    on_change fires on the listener thread — callers must hop back to the UI
+    thread themselves (e.g. via widget.after). Returns True when the listener
+    window is up, False on non-Windows platforms or if setup fails (callers
+    should fall back to polling).
+    """
+    if sys.platform != "win32":
+        return False
+
+    try:
+        from ctypes import wintypes
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    except OSError:
+        return False
+
+    WNDPROC = ctypes.WINFUNCTYPE(
+        ctypes.c_ssize_t,
+        wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM,
+    )
+
+    class WNDCLASSW(ctypes.Structure):
+        _fields_ = [
+            ("style", wintypes.UINT),
+            ("lpfnWndProc", WNDPROC),
+            ("cbClsExtra", ctypes.c_int),
+            ("cbWndExtra", ctypes.c_int),
+            ("hInstance", wintypes.HINSTANCE),
+            ("hIcon", wintypes.HICON),
+            ("hCursor", ctypes.c_void_p),
+            ("hbrBackground", wintypes.HBRUSH),
+            ("lpszMenuName", wintypes.LPCWSTR),
+            ("lpszClassName", wintypes.LPCWSTR),
+        ]
+
+    # Bind prototypes before calling: without a restype, ctypes truncates
+    # HMODULE/HWND through the default c_int — on 64-bit the module handle
+    # sits above 4 GB, leaving wc.hInstance garbage and the window-class
+    # registration silently broken.
+    kernel32.GetModuleHandleW.argtypes = (wintypes.LPCWSTR,)
+    kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+    user32.RegisterClassW.argtypes = (ctypes.POINTER(WNDCLASSW),)
+    user32.RegisterClassW.restype = wintypes.ATOM
+    user32.CreateWindowExW.argtypes = (
+        wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+        ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+    )
+    user32.CreateWindowExW.restype = wintypes.HWND
+    user32.DefWindowProcW.argtypes = (
+        wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM,
+    )
+    user32.DefWindowProcW.restype = ctypes.c_ssize_t  # LRESULT
+    user32.GetMessageW.argtypes = (
+        ctypes.POINTER(wintypes.MSG), wintypes.HWND,
+        wintypes.UINT, wintypes.UINT,
+    )
+    user32.GetMessageW.restype = ctypes.c_int
+    user32.TranslateMessage.argtypes = (ctypes.POINTER(wintypes.MSG),)
+    user32.TranslateMessage.restype = wintypes.BOOL
+    user32.DispatchMessageW.argtypes = (ctypes.POINTER(wintypes.MSG),)
+    user32.DispatchMessageW.restype = ctypes.c_ssize_t  # LRESULT
+
+    def _wnd_proc(hwnd, msg, wparam, lparam):
+        if msg == WM_DEVICECHANGE and wparam in (
+            DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE,
+        ):
+            try:
+                on_change()
+            except Exception:
+                log.exception("Device-change callback failed")
+        return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+    proc = WNDPROC(_wnd_proc)
+    _keepalive.append(proc)
+    created = threading.Event()
+    ok = [False]
+
+    def _pump() -> None:
+        wc = WNDCLASSW()
+        wc.lpfnWndProc = proc
+        wc.hInstance = kernel32.GetModuleHandleW(None)
+        wc.lpszClassName = _WINDOW_CLASS
+        if not user32.RegisterClassW(ctypes.byref(wc)):
+            log.warning("RegisterClassW failed: %s", ctypes.get_last_error())
+            created.set()
+            return
+        _keepalive.append(wc)
+        # Hidden top-level window (message-only windows do not receive
+        # WM_DEVICECHANGE broadcasts).
+        hwnd = user32.CreateWindowExW(
+            0, _WINDOW_CLASS, None, 0, 0, 0, 0, 0, None, None, wc.hInstance, None,
+        )
+        if not hwnd:
+            log.warning("CreateWindowExW failed: %s", ctypes.get_last_error())
+            created.set()
+            return
+        ok[0] = True
+        created.set()
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+
+    threading.Thread(target=_pump, daemon=True, name="devnotify").start()
+    created.wait(timeout=5.0)
+    return ok[0]